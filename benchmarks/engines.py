@@ -0,0 +1,118 @@
+"""Aggregation engine comparison: pandas vs Polars vs DuckDB on the ESG data
+
+Times the operations pages issue through esg.engines (a filter, the yearly
+and per-industry group-bys, the per-company leaderboard aggregation and its
+top-k) with every available engine, at several data scales. Engines whose
+package is not installed are reported as skipped. Usage::
+
+    python benchmarks/engines.py --scales 1 10 100 --output engines.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.pages import dataset, metadata  # noqa: E402
+from esg.data import read_dataset  # noqa: E402
+from esg.engines import ENGINES, get_engine  # noqa: E402
+
+# A mid-selectivity sidebar state: six years, three industries, ESG >= 40
+RANGES = {"Year": (2018, 2023), "ESG_Overall": (40, None)}
+CATEGORIES = {"Industry": ["Energy", "Finance", "Technology"]}
+
+LEADERBOARD_SPEC = {
+    "ESG_Overall": "mean",
+    "ESG_Environmental": "mean",
+    "ESG_Social": "mean",
+    "ESG_Governance": "mean",
+    "Industry": "first",
+    "Revenue": "mean",
+}
+
+
+def operations(engine, df):
+    """(name, callable) pairs timed for one engine, in page order"""
+    view = df.iloc[engine.filter(df, RANGES, CATEGORIES)]
+    performers = engine.aggregate(view, "CompanyName", LEADERBOARD_SPEC)
+    performers = performers.reset_index()
+    return [
+        ("filter", lambda: engine.filter(df, RANGES, CATEGORIES)),
+        (
+            "groupby Year",
+            lambda: engine.aggregate(
+                view, "Year", {"ESG_Overall": ["mean", "std", "count"]}
+            ),
+        ),
+        (
+            "groupby Year x Industry",
+            lambda: engine.aggregate(
+                view, ["Year", "Industry"], {"ESG_Overall": "mean", "Revenue": "sum"}
+            ),
+        ),
+        (
+            "groupby CompanyName",
+            lambda: engine.aggregate(view, "CompanyName", LEADERBOARD_SPEC),
+        ),
+        (
+            "top-k",
+            lambda: engine.top_k(
+                performers, ["ESG_Overall", "ESG_Environmental", "ESG_Social"], 10
+            ),
+        ),
+    ]
+
+
+def time_call(function, repeats):
+    """Median wall time of function in ms, after one warm-up call"""
+    function()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return round(float(np.median(times)) * 1000, 2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for scale in args.scales:
+        df = read_dataset(dataset(scale))
+        for name in args.engines:
+            try:
+                engine = get_engine(name)
+            except ImportError as error:
+                results.append({"scale": scale, "engine": name, "skipped": str(error)})
+                continue
+            for operation, function in operations(engine, df):
+                ms = time_call(function, args.repeats)
+                results.append(
+                    {"scale": scale, "engine": name, "operation": operation, "ms": ms}
+                )
+                print(
+                    f"x{scale:<5} {name:<7} {operation:<24} {ms:>9} ms",
+                    file=sys.stderr,
+                )
+
+    report = json.dumps({"meta": metadata(), "results": results}, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Headless rerun benchmark of every dashboard page at several data scales
+
+Each page is rendered with Streamlit's AppTest against the bundled dataset
+(scale 1) and against synthetic datasets 10x, 100x and 1000x larger, while
+a fixed sweep of sidebar filter combinations is applied. Every (scale,
+page) pair runs in a fresh interpreter, so caches start cold and the peak
+RSS reported is that page's own. Results are JSON, for diffing between
+versions. Usage::
+
+    python benchmarks/pages.py --scales 1 10 100 --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+BUNDLED = ROOT / "data" / "esg_financial_dataset.csv"
+DATA_DIR = ROOT / "benchmarks" / "data"
+
+
+# Sidebar sweep: (name, {widget label: value}); values are applied on top of
+# the defaults, in order
+FILTER_SWEEP = [
+    ("defaults", {}),
+    ("recent years", {"Year Range": (2020, 2025)}),
+    ("one industry", {"Industries": ["Technology"]}),
+    ("two regions", {"Regions": ["Europe", "Asia"]}),
+    ("ESG >= 60", {"Minimum ESG Score": 60}),
+    (
+        "combined",
+        {
+            "Year Range": (2018, 2023),
+            "Industries": ["Energy", "Finance", "Technology"],
+            "Minimum ESG Score": 40,
+        },
+    ),
+]
+
+
+def dataset(scale, seed=0):
+    """Path of the dataset for a scale, generating synthetic ones on first use"""
+    if scale == 1:
+        return BUNDLED
+    from esg.synthetic import write_dataset
+
+    path = DATA_DIR / f"esg_x{scale}.parquet"
+    if not path.exists():
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # The bundled dataset has 1,000 companies over 11 years
+        write_dataset(path, companies=1000 * scale, seed=seed)
+    return path
+
+
+def _widget(at, label):
+    """Sidebar widget with the given label"""
+    for kind in ("slider", "multiselect"):
+        for widget in getattr(at.sidebar, kind):
+            if widget.label == label:
+                return widget
+    raise KeyError(f"no sidebar widget labelled {label!r}")
+
+
+def _percentiles(times):
+    times = np.asarray(times) * 1000
+    return round(float(np.median(times)), 1), round(float(np.percentile(times, 95)), 1)
+
+
+def bench_page(page, repeats):
+    """Rerun latencies of one page over FILTER_SWEEP (runs in the child process)"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=600)
+    start = time.perf_counter()
+    at.run()
+    if page != at.sidebar.radio[0].value:
+        at.sidebar.radio[0].set_value(page).run()
+    cold = time.perf_counter() - start
+
+    # Every combination is applied on top of the default filter values
+    widgets = list(at.sidebar.slider) + list(at.sidebar.multiselect)
+    defaults = {widget.label: widget.value for widget in widgets}
+
+    times, errors = [], []
+    for _ in range(repeats):
+        for name, values in FILTER_SWEEP:
+            for label, default in defaults.items():
+                _widget(at, label).set_value(
+                    _clamp(values.get(label, default), default)
+                )
+            start = time.perf_counter()
+            at.run()
+            times.append(time.perf_counter() - start)
+            errors += [f"{name}: {error.message}" for error in at.exception]
+
+    p50, p95 = _percentiles(times)
+    # ru_maxrss is in KiB on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {
+        "cold_ms": round(cold * 1000, 1),
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "runs": len(times),
+        "peak_rss_mb": round(peak, 1),
+        "errors": errors[:5],
+    }
+
+
+def _clamp(value, default):
+    """A sweep value restricted to what the dataset offers
+
+    Year ranges are clipped to the default (full) range and category lists
+    keep only values that exist, falling back to the default when none do.
+    """
+    if isinstance(default, tuple):
+        return (max(value[0], default[0]), min(value[1], default[1]))
+    if isinstance(default, list):
+        return [option for option in value if option in default] or default
+    return value
+
+
+def run_child(scale, page, repeats, env):
+    """Benchmark one page at one scale in a fresh interpreter"""
+    command = [
+        sys.executable,
+        __file__,
+        "--child",
+        json.dumps({"page": page, "repeats": repeats}),
+    ]
+    env = {
+        **os.environ,
+        **env,
+        "DATA_PATH": str(dataset(scale)),
+        "PYTHONPATH": str(ROOT),
+    }
+    result = subprocess.run(
+        command, cwd=ROOT, env=env, capture_output=True, text=True, check=False
+    )
+    if result.returncode != 0:
+        return {"errors": result.stderr.strip().splitlines()[-1:]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def metadata():
+    """Versions and revision the results belong to"""
+    import pandas as pd
+    import streamlit
+
+    revision = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    ).stdout.strip()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": revision,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "streamlit": streamlit.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def main(argv=None):
+    from views import PAGES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--pages", nargs="+", default=list(PAGES))
+    parser.add_argument("--repeats", type=int, default=3, help="sweeps per page")
+    parser.add_argument(
+        "--engines", nargs="+", default=["pandas"], help="AGGREGATION_ENGINE values"
+    )
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        options = json.loads(args.child)
+        print(json.dumps(bench_page(options["page"], options["repeats"])))
+        return
+
+    results = []
+    for scale in args.scales:
+        for engine in args.engines:
+            for page in args.pages:
+                result = run_child(
+                    scale, page, args.repeats, {"AGGREGATION_ENGINE": engine}
+                )
+                results.append(
+                    {"scale": scale, "engine": engine, "page": page, **result}
+                )
+                print(
+                    f"x{scale:<5} {engine:<7} {page:<20} "
+                    f"p50 {result.get('p50_ms', '-'):>8} ms  "
+                    f"p95 {result.get('p95_ms', '-'):>8} ms  "
+                    f"peak {result.get('peak_rss_mb', '-'):>8} MB",
+                    file=sys.stderr,
+                )
+
+    report = json.dumps({"meta": metadata(), "results": results}, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(ROOT))
+    main()
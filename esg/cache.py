@@ -0,0 +1,123 @@
+"""Memory-bounded caches shared by all sessions of the app"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def nbytes(value):
+    """Approximate memory held by a cached value"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True, deep=False)
+        return int(usage.sum()) if isinstance(value, pd.DataFrame) else int(usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(nbytes(item) for item in value.values())
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+def fingerprint(*values):
+    """Hex digest identifying values by content: frames, arrays, containers, scalars
+
+    Equal contents give equal digests across reruns and sessions, so it keys
+    caches of results computed from those values.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _digest(digest, values)
+    return digest.hexdigest()
+
+
+def _digest(digest, value):
+    digest.update(type(value).__name__.encode())
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        labels = value.columns if isinstance(value, pd.DataFrame) else value.name
+        dtypes = value.dtypes if isinstance(value, pd.DataFrame) else value.dtype
+        digest.update(repr((value.shape, labels, dtypes)).encode())
+        hashes = pd.util.hash_pandas_object(
+            value, index=not isinstance(value, pd.Index)
+        )
+        digest.update(hashes.to_numpy().tobytes())
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(repr((value.shape, value.dtype.str)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.ndarray):
+        _digest(digest, pd.Series(value.ravel()))
+    elif isinstance(value, dict):
+        digest.update(str(len(value)).encode())
+        for key, item in value.items():
+            _digest(digest, key)
+            _digest(digest, item)
+    elif isinstance(value, (tuple, list)):
+        digest.update(str(len(value)).encode())
+        for item in value:
+            _digest(digest, item)
+    else:
+        digest.update(repr(value).encode())
+    # Ends every value, so that adjacent values cannot run together
+    digest.update(b"\x00")
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache bounded by total value size"""
+
+    def __init__(self, max_bytes, sizeof=nbytes):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get_or_compute(self, key, compute):
+        """Cached value for key, computing and storing it on a miss"""
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key][0]
+            self.misses += 1
+
+        # Computed outside the lock so other sessions are not blocked
+        value = compute()
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._items:
+                self.bytes -= self._items.pop(key)[1]
+            self._items[key] = (value, size)
+            self.bytes += size
+            # Keep at least the newest entry, even if it alone is over budget
+            while self.bytes > self.max_bytes and len(self._items) > 1:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self.bytes -= evicted
+        return value
+
+    def clear(self):
+        """Drop every cached value"""
+        with self._lock:
+            self._items.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Entry count, size and hit rate for display"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "MB": self.bytes / 1024**2,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
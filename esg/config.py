@@ -0,0 +1,71 @@
+"""Runtime settings, read from the environment or an optional .env file"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Location of the ESG dataset
+DATA_PATH = os.getenv("DATA_PATH", "./data/esg_financial_dataset.csv")
+
+# Columnar sidecar written next to a CSV dataset: "parquet" or "feather"
+SIDECAR_FORMAT = os.getenv("DATA_SIDECAR_FORMAT", "parquet")
+
+# Directory of incremental updates (a new year's rows, or corrected rows),
+# merged on top of DATA_PATH in file name order
+DELTA_DIR = os.getenv("DATA_DELTA_DIR", "./data/deltas")
+
+# Where queries run: "memory" loads the dataset into pandas, "duckdb" queries
+# the Parquet file(s) at DATA_PATH (a file, directory or glob) in place, for
+# datasets larger than RAM
+DATA_BACKEND = os.getenv("DATA_BACKEND", "memory")
+
+# DuckDB memory limit in out-of-core mode; larger intermediates spill to disk
+DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", "1GB")
+
+# Rows sampled from the filtered data for row-level charts in out-of-core mode
+OUT_OF_CORE_SAMPLE_ROWS = int(os.getenv("OUT_OF_CORE_SAMPLE_ROWS", "200000"))
+
+# Engine for filters, group-bys and top-k selections over in-memory frames:
+# "pandas", "polars" or "duckdb" (compare them with benchmarks/engines.py)
+AGGREGATION_ENGINE = os.getenv("AGGREGATION_ENGINE", "pandas")
+
+# Worker threads running a page's independent aggregations concurrently;
+# 1 runs them one after another on the script thread
+AGGREGATION_THREADS = int(
+    os.getenv("AGGREGATION_THREADS", str(min(8, os.cpu_count() or 1)))
+)
+
+# Memory budget for filtered views shared across pages and sessions
+VIEW_CACHE_MB = float(os.getenv("VIEW_CACHE_MB", "256"))
+
+# Memory budget for cached chart figures shared across pages and sessions
+FIGURE_CACHE_MB = float(os.getenv("FIGURE_CACHE_MB", "64"))
+
+# Companies shown per leadership board ranking
+LEADERBOARD_SIZE = int(os.getenv("LEADERBOARD_SIZE", "10"))
+
+# Order of equal leaderboard scores: "first" or "last" company (by name), or a
+# leaderboard column such as "Revenue" or "Industry" where the larger value wins
+LEADERBOARD_TIE_BREAK = os.getenv("LEADERBOARD_TIE_BREAK", "first")
+
+# Most points a scatter plot sends to the browser, and how they are chosen:
+# "stratified", "density" or "none" (plot every row)
+SCATTER_POINT_BUDGET = int(os.getenv("SCATTER_POINT_BUDGET", "5000"))
+SCATTER_SAMPLING = os.getenv("SCATTER_SAMPLING", "stratified")
+
+# Scatter plots with more points than this are drawn with WebGL
+SCATTER_WEBGL_THRESHOLD = int(os.getenv("SCATTER_WEBGL_THRESHOLD", "1000"))
+
+# Outliers drawn per box plot; the rest are summarised by the whiskers
+BOX_OUTLIER_SAMPLE = int(os.getenv("BOX_OUTLIER_SAMPLE", "100"))
+
+# Profile every data step and chart of each rerun (also enabled per session
+# with the ?profile=1 query parameter, which skips memory tracing); steps are
+# appended to PROFILE_LOG
+PROFILING = os.getenv("PROFILING", "false").lower() in ("1", "true", "yes")
+PROFILE_LOG = os.getenv("PROFILE_LOG", "./output/profile.jsonl")
+
+# Rows per chunk when streaming a sidebar export
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "100000"))
@@ -0,0 +1,186 @@
+"""Pre-aggregated Year x Industry x Region cube of per-metric moments"""
+
+import numpy as np
+import pandas as pd
+
+DIMENSIONS = ("Year", "Industry", "Region")
+
+# Statistics derivable from count, sum and sum of squares
+CUBE_STATISTICS = {"count", "sum", "mean", "var", "std"}
+
+
+class Cube:
+    """Count, sum and sum of squares of each metric per (Year, Industry, Region)
+
+    Means, variances and standard deviations for any selection of years,
+    industries and regions, grouped by any subset of the three dimensions,
+    are reduced from the cells without touching the raw rows.
+    """
+
+    def __init__(self, df, metrics):
+        self.metrics = list(metrics)
+        self.years = np.unique(df["Year"].to_numpy())
+        self.industries = pd.Categorical(df["Industry"]).categories
+        self.regions = pd.Categorical(df["Region"]).categories
+        self.shape = (len(self.years), len(self.industries), len(self.regions))
+        self._rows, self._count, self._sum, self._sumsq = self._aggregate(df)
+
+    def with_years(self, df, years):
+        """Copy of the cube with the cells of some years rebuilt from df
+
+        df holds the current rows of those years (other rows are ignored);
+        years not in the cube yet are added. Returns None when df brings an
+        industry or region the cube has no axis for, so the caller rebuilds.
+        """
+        years = np.unique(np.asarray(list(years), dtype=self.years.dtype))
+        df = df[df["Year"].isin(years)]
+        for labels, column in ((self.industries, "Industry"), (self.regions, "Region")):
+            present = pd.Index(df[column].unique()).dropna().astype(str)
+            if not present.isin(labels.astype(str)).all():
+                return None
+
+        cube = object.__new__(Cube)
+        cube.metrics, cube.industries, cube.regions = (
+            self.metrics,
+            self.industries,
+            self.regions,
+        )
+        cube.years = np.union1d(self.years, years)
+        cube.shape = (len(cube.years),) + self.shape[1:]
+        # Carry over every untouched year; the rebuilt years start empty
+        source = np.flatnonzero(~np.isin(self.years, years))
+        target = np.searchsorted(cube.years, self.years[source])
+        arrays = []
+        for array in (self._rows, self._count, self._sum, self._sumsq):
+            grown = np.zeros(cube.shape + array.shape[3:], dtype=array.dtype)
+            grown[target] = array[source]
+            arrays.append(grown)
+        for array, fresh in zip(arrays, cube._aggregate(df)):
+            array += fresh
+        cube._rows, cube._count, cube._sum, cube._sumsq = arrays
+        return cube
+
+    def _cells(self, df):
+        """Flat cell number of every row"""
+        year = np.searchsorted(self.years, df["Year"].to_numpy())
+        industry = pd.Categorical(df["Industry"], categories=self.industries).codes
+        region = pd.Categorical(df["Region"], categories=self.regions).codes
+        return (year * self.shape[1] + industry) * self.shape[2] + region
+
+    def _aggregate(self, df):
+        """Moments of every metric for each cell of df"""
+        cells = self._cells(df)
+        size = int(np.prod(self.shape))
+        count = np.zeros((size, len(self.metrics)))
+        total = np.zeros_like(count)
+        sumsq = np.zeros_like(count)
+        for position, metric in enumerate(self.metrics):
+            values = df[metric].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            cell, values = cells[valid], values[valid]
+            count[:, position] = np.bincount(cell, minlength=size)
+            total[:, position] = np.bincount(cell, weights=values, minlength=size)
+            sumsq[:, position] = np.bincount(
+                cell, weights=values * values, minlength=size
+            )
+        rows = np.bincount(cells, minlength=size)
+        return tuple(
+            array.reshape(self.shape + array.shape[1:])
+            for array in (rows, count, total, sumsq)
+        )
+
+    def _masks(self, years, industries, regions):
+        """Boolean selection along each dimension"""
+        year_mask = np.ones(len(self.years), dtype=bool)
+        if years is not None:
+            year_mask = (self.years >= years[0]) & (self.years <= years[1])
+        masks = [year_mask]
+        for labels, selected in (
+            (self.industries, industries),
+            (self.regions, regions),
+        ):
+            mask = np.ones(len(labels), dtype=bool)
+            if selected is not None:
+                mask[:] = False
+                indexer = labels.get_indexer(list(selected))
+                mask[indexer[indexer >= 0]] = True
+            masks.append(mask)
+        return masks
+
+    def aggregate(self, by, spec, years=None, industries=None, regions=None):
+        """Grouped statistics over a selection, like DataFrame.groupby().agg()
+
+        by is one dimension or a list of them; spec maps each metric to a
+        statistic ("count", "sum", "mean", "var", "std") or a list of them.
+        years is an inclusive (first, last) pair; industries and regions are
+        the allowed values. None selects everything. Only groups that
+        contain rows are returned, as with observed=True.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        masks = self._masks(years, industries, regions)
+        selection = np.ix_(*masks)
+        labels = [
+            values[mask]
+            for values, mask in zip((self.years, self.industries, self.regions), masks)
+        ]
+
+        # Sum away the dimensions not grouped on, then order axes as in `by`
+        axes = tuple(a for a, name in enumerate(DIMENSIONS) if name not in by)
+        kept = sorted(by, key=DIMENSIONS.index)
+        order = [kept.index(name) for name in by]
+        metric_index = [self.metrics.index(metric) for metric in spec]
+
+        def reduce(array):
+            return (
+                array[selection]
+                .sum(axis=axes)
+                .transpose(order + list(range(len(by), array.ndim - len(axes))))
+            )
+
+        rows = reduce(self._rows).ravel()
+        keep = rows > 0
+        count, total, sumsq = (
+            reduce(array[..., metric_index]).reshape(-1, len(metric_index))[keep]
+            for array in (self._count, self._sum, self._sumsq)
+        )
+
+        if len(by) == 1:
+            index = pd.Index(labels[DIMENSIONS.index(by[0])], name=by[0])
+        else:
+            index = pd.MultiIndex.from_product(
+                [labels[DIMENSIONS.index(name)] for name in by], names=by
+            )
+        index = index[keep]
+
+        return moment_statistics(count, total, sumsq, spec, index)
+
+
+def moment_statistics(count, total, sumsq, spec, index):
+    """groupby().agg(spec)-shaped frame from per-group moments
+
+    count, total and sumsq are (groups, metrics) arrays, with one metric
+    column per spec entry in order, and index labels the groups.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count, np.nan)
+        var = np.where(count > 1, (sumsq - total * mean) / (count - 1), np.nan).clip(
+            min=0
+        )
+    statistics = {
+        "count": count,
+        "sum": total,
+        "mean": mean,
+        "var": var,
+        "std": np.sqrt(var),
+    }
+
+    flat = all(isinstance(stats, str) for stats in spec.values())
+    columns = {}
+    for position, (metric, stats) in enumerate(spec.items()):
+        for stat in [stats] if isinstance(stats, str) else stats:
+            key = metric if flat else (metric, stat)
+            columns[key] = statistics[stat][:, position]
+    result = pd.DataFrame(columns, index=index)
+    if not flat:
+        result.columns = pd.MultiIndex.from_tuples(result.columns)
+    return result
@@ -0,0 +1,316 @@
+"""Typed loading of the ESG dataset and its columnar sidecar"""
+
+import functools
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from esg import config
+
+# ============================================================================
+# SCHEMA
+# ============================================================================
+CATEGORY_COLUMNS = ["CompanyName", "Industry", "Region"]
+
+METRIC_COLUMNS = [
+    "Revenue",
+    "ProfitMargin",
+    "MarketCap",
+    "GrowthRate",
+    "ESG_Overall",
+    "ESG_Environmental",
+    "ESG_Social",
+    "ESG_Governance",
+    "CarbonEmissions",
+    "WaterUsage",
+    "EnergyConsumption",
+]
+
+# Bounded scores and percentages, which round-trip through float32 at their
+# one decimal.
+# Amounts and resource volumes stay float64: they exceed float32's 2^24
+# integer range (EnergyConsumption reaches 1.7e9)
+FLOAT32_COLUMNS = [
+    "ProfitMargin",
+    "GrowthRate",
+    "ESG_Overall",
+    "ESG_Environmental",
+    "ESG_Social",
+    "ESG_Governance",
+]
+
+SCHEMA = {
+    "CompanyID": "int32",
+    "CompanyName": "category",
+    "Industry": "category",
+    "Region": "category",
+    "Year": "int16",
+    **{
+        column: "float32" if column in FLOAT32_COLUMNS else "float64"
+        for column in METRIC_COLUMNS
+    },
+}
+
+COLUMNS = list(SCHEMA)
+
+# A row is one company in one year; delta rows replace rows with the same key
+KEY_COLUMNS = ["CompanyID", "Year"]
+
+COLUMNAR_SUFFIXES = (".parquet", ".feather", ".arrow")
+
+
+def apply_schema(df):
+    """Cast a frame with the dataset columns to the explicit schema"""
+    dtypes = {column: SCHEMA[column] for column in df.columns if column in SCHEMA}
+    return df.astype(dtypes, copy=False)
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+def read_csv(path, columns=None):
+    """Parse the dataset CSV straight into the typed schema"""
+    usecols = COLUMNS if columns is None else [c for c in COLUMNS if c in columns]
+    df = pd.read_csv(path, usecols=usecols, dtype={c: SCHEMA[c] for c in usecols})
+    return df[usecols]
+
+
+def read_columnar(path, columns=None):
+    """Read a Parquet or Feather/Arrow IPC dataset, optionally only some columns"""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        df = pd.read_feather(path, columns=columns)
+    # Files produced elsewhere may not carry the pandas dtype metadata
+    return apply_schema(df)
+
+
+def read_dataset(path, columns=None):
+    """Read a dataset file of any supported format (by suffix)"""
+    if Path(path).suffix in COLUMNAR_SUFFIXES:
+        return read_columnar(path, columns)
+    return read_csv(path, columns)
+
+
+def write_columnar(df, path):
+    """Atomically write a frame as Parquet or Feather/Arrow IPC (by suffix)"""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if path.suffix == ".parquet":
+        df.to_parquet(tmp, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(tmp)
+    os.replace(tmp, path)
+
+
+def sidecar_path(path):
+    """Columnar sidecar kept next to a CSV dataset"""
+    return Path(path).with_suffix(f".{config.SIDECAR_FORMAT}")
+
+
+@functools.lru_cache(maxsize=16)
+def _stored_schema(path, mtime_ns):
+    """Arrow schema of a columnar file, read once per modification"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if Path(path).suffix == ".parquet":
+        return pq.read_schema(path)
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def sidecar_is_current(path, sidecar):
+    """Whether a sidecar is newer than its CSV and holds full-precision amounts
+
+    Sidecars written when every metric was float32 are rewritten, as their
+    amounts were already rounded.
+    """
+    import pyarrow as pa
+
+    if not sidecar.exists() or sidecar.stat().st_mtime_ns < path.stat().st_mtime_ns:
+        return False
+    stored = _stored_schema(str(sidecar), sidecar.stat().st_mtime_ns)
+    return not any(
+        stored.field(column).type == pa.float32()
+        for column in METRIC_COLUMNS
+        if column not in FLOAT32_COLUMNS and column in stored.names
+    )
+
+
+def columnar_source(path):
+    """Columnar file backing a dataset path, converting the CSV when it is newer"""
+    path = Path(path)
+    if path.suffix in COLUMNAR_SUFFIXES:
+        if not path.exists():
+            raise FileNotFoundError(path)
+        return path
+
+    sidecar = sidecar_path(path)
+    if not path.exists():
+        # Columnar dataset shipped instead of the CSV
+        if sidecar.exists():
+            return sidecar
+        raise FileNotFoundError(path)
+
+    if not sidecar_is_current(path, sidecar):
+        write_columnar(read_csv(path), sidecar)
+    return sidecar
+
+
+# ============================================================================
+# INCREMENTAL UPDATES
+# ============================================================================
+def row_keys(df):
+    """One int64 per row identifying its (CompanyID, Year)"""
+    return df["CompanyID"].to_numpy(np.int64) << 16 | df["Year"].to_numpy(np.int64)
+
+
+def concat_rows(top, bottom):
+    """Stack two frames, merging category columns instead of falling back to object
+
+    Categories new in bottom are appended, so existing codes stay valid.
+    """
+    top, bottom = top.copy(deep=False), bottom[list(top.columns)].copy(deep=False)
+    for column in top.select_dtypes("category").columns:
+        known = top[column].cat.categories
+        values = bottom[column].astype("category").cat.categories
+        categories = known.append(values[~values.isin(known)])
+        top[column] = top[column].cat.set_categories(categories)
+        bottom[column] = pd.Categorical(bottom[column], categories=categories)
+    return pd.concat([top, bottom], ignore_index=True)
+
+
+def merge_rows(frame, delta):
+    """frame with delta applied: rows sharing a (CompanyID, Year) are replaced
+
+    Replacements and new rows are appended after the unchanged rows, so the
+    result depends only on frame and delta, whichever columns are loaded.
+    """
+    keep = ~np.isin(row_keys(frame), row_keys(delta))
+    return concat_rows(frame[keep], delta)
+
+
+class DatasetStore:
+    """Shared, lazily widened frame over the dataset's columnar file
+
+    Columns are read from disk the first time a page asks for them and kept
+    for every later request. The source is re-checked on each access, so a
+    newer CSV is converted and the cached columns are dropped.
+
+    Files dropped into delta_dir (CSV or columnar, full rows of one new
+    year or of corrected rows) are merged on top of the base dataset in
+    file name order. Only the new file is parsed; the base is not re-read.
+    """
+
+    def __init__(self, path, delta_dir=None):
+        self.path = path
+        self.delta_dir = Path(delta_dir) if delta_dir else None
+        self.source = None
+        self.version = None
+        self._frame = None
+        self._deltas = []
+        self._lock = threading.Lock()
+
+    def _delta_files(self):
+        """(name, mtime) of the delta files, in the order they apply"""
+        if self.delta_dir is None or not self.delta_dir.is_dir():
+            return []
+        return sorted(
+            (path.name, path.stat().st_mtime_ns)
+            for path in self.delta_dir.iterdir()
+            if path.suffix in (".csv",) + COLUMNAR_SUFFIXES
+        )
+
+    def refresh(self):
+        """Re-resolve the source and deltas, keeping what is still valid
+
+        A changed base file drops every cached column. New delta files are
+        merged into the cached frame; a changed or removed one replays all
+        deltas from the base.
+        """
+        source = columnar_source(self.path)
+        base = (str(source), source.stat().st_mtime_ns)
+        files = self._delta_files()
+        applied = [key for key, _ in self._deltas]
+        if self.version is None or base != self.version[:2]:
+            self.source, self._frame, self._deltas = source, None, []
+        elif files[: len(applied)] != applied:
+            self._frame, self._deltas = None, []
+
+        for name, mtime in files[len(self._deltas) :]:
+            delta = read_dataset(self.delta_dir / name)
+            self._deltas.append(((name, mtime), delta))
+            if self._frame is not None:
+                self._frame = merge_rows(self._frame, delta)
+        self.version = base + (tuple(key for key, _ in self._deltas),)
+
+    def changed_years(self, version):
+        """Years whose rows changed between an earlier version and now
+
+        None when the change is not a pure addition of deltas, i.e. when
+        everything derived from the earlier version must be rebuilt.
+        """
+        if version is None or self.version is None:
+            return None
+        old, new = version[2], self.version[2]
+        if version[:2] != self.version[:2] or new[: len(old)] != old:
+            return None
+        return {
+            int(year)
+            for _, delta in self._deltas[len(old) :]
+            for year in delta["Year"].unique()
+        }
+
+    def _read(self, columns):
+        """Columns of the base file with every delta applied"""
+        keys = [c for c in KEY_COLUMNS if c not in columns]
+        frame = read_columnar(self.source, list(columns) + keys)
+        for _, delta in self._deltas:
+            frame = merge_rows(frame, delta)
+        return frame.drop(columns=keys)
+
+    def frame(self, columns=None, keep=True):
+        """Frame holding at least the requested columns (all when None)
+
+        With keep=False, columns not loaded yet are read for this call only
+        and the shared frame is not widened (for one-off readers like exports).
+        """
+        wanted = COLUMNS if columns is None else [c for c in COLUMNS if c in columns]
+        with self._lock:
+            self.refresh()
+            loaded = [] if self._frame is None else list(self._frame.columns)
+            # Deltas are merged on the row keys, so keep them loaded
+            missing = [c for c in wanted + KEY_COLUMNS if c not in loaded]
+            missing = [c for c in COLUMNS if c in missing]
+            if not missing:
+                return self._frame
+            # Build a new frame rather than inserting in place: other
+            # sessions may still be reading the previous one
+            new = self._read(missing)
+            if self._frame is not None:
+                # In COLUMNS order whichever page loaded what first, so
+                # exports and other whole-frame readers are deterministic
+                new = pd.concat([self._frame, new], axis=1, copy=False)
+                new = new[[c for c in COLUMNS if c in new.columns]]
+            if keep:
+                self._frame = new
+            return new
+
+
+def memory_report(df):
+    """Per-column memory use of a frame, largest first"""
+    usage = df.memory_usage(index=False, deep=True)
+    report = pd.DataFrame(
+        {
+            "dtype": df.dtypes.astype(str),
+            "MB": usage / 1024**2,
+            "Share (%)": usage / usage.sum() * 100,
+        }
+    )
+    report.index.name = "Column"
+    return report.sort_values("MB", ascending=False).round(3)
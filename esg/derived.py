@@ -0,0 +1,40 @@
+"""Metrics derived from dataset columns, declared once and computed on demand
+
+Row-wise metrics are computed once per dataset version over every row, and
+a filtered view takes its rows from that column. Metrics whose value depends
+on which rows are selected, such as quartiles, are computed per view. Pages
+read both through PageContext.derived(), never by adding columns to
+filtered_df.
+"""
+
+from collections import namedtuple
+
+import pandas as pd
+
+# inputs: dataset columns the metric reads; compute: function of a frame with
+# those columns returning a Series aligned with it; per_view: the value of a
+# row depends on the other selected rows, so it is computed per filtered view
+DerivedMetric = namedtuple("DerivedMetric", ["inputs", "compute", "per_view"])
+
+ESG_QUARTILES = ["Q1 (Lowest)", "Q2", "Q3", "Q4 (Highest)"]
+
+
+def resource_efficiency(df):
+    """Revenue per unit of carbon, water and energy use, scaled by 1e6"""
+    usage = df["CarbonEmissions"] + df["WaterUsage"] + df["EnergyConsumption"]
+    return df["Revenue"] / usage * 1000000
+
+
+def esg_quartile(df):
+    """Quartile of ESG_Overall among the given rows"""
+    return pd.qcut(df["ESG_Overall"], q=4, labels=ESG_QUARTILES)
+
+
+DERIVED_METRICS = {
+    "Resource_Efficiency": DerivedMetric(
+        ["Revenue", "CarbonEmissions", "WaterUsage", "EnergyConsumption"],
+        resource_efficiency,
+        per_view=False,
+    ),
+    "ESG_Quartile": DerivedMetric(["ESG_Overall"], esg_quartile, per_view=True),
+}
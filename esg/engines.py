@@ -0,0 +1,286 @@
+"""Interchangeable engines behind one filter / aggregate / top-k API
+
+Every engine takes pandas frames and returns what pandas would: row
+positions for a filter, a groupby().agg()-shaped frame for an aggregation
+and best-first positions for a top-k. Pages can therefore switch between
+pandas, Polars and in-process DuckDB (AGGREGATION_ENGINE) without changes.
+Polars and DuckDB are optional dependencies, imported on first use.
+"""
+
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from esg.outofcore import aggregate_frame, aggregate_sql, quote_name, sql_literal
+from esg.ranking import tie_order, top_k
+
+
+def _as_list(stats):
+    return [stats] if isinstance(stats, str) else list(stats)
+
+
+def _is_flat(spec):
+    return all(isinstance(stats, str) for stats in spec.values())
+
+
+def _best_first(scores, largest, ties):
+    """Valid scores, tie priorities and positions of one column, for sorting"""
+    scores = np.asarray(scores, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(scores))
+    keys = -scores[valid] if largest else scores[valid]
+    return keys, tie_order(ties, len(scores))[valid], valid
+
+
+def _firsts(spec):
+    """Columns of a flat aggregation result holding first values"""
+    if not _is_flat(spec):
+        return []
+    return [metric for metric, stats in spec.items() if stats == "first"]
+
+
+def _source_dtypes(result, df, columns):
+    """result with the given columns in df's dtypes, categories in df's order"""
+    result = result.copy()
+    for column in columns:
+        dtype = df[column].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Unordered categories compare equal in any order, so astype would
+            # keep the engine's order of appearance
+            values = result[column].astype("category")
+            result[column] = values.cat.set_categories(
+                dtype.categories, ordered=dtype.ordered
+            )
+        else:
+            result[column] = result[column].astype(dtype)
+    return result
+
+
+def _normalized(result):
+    """An aggregation result with float64 and int64 values, from any engine"""
+    dtypes = {}
+    for column, dtype in result.dtypes.items():
+        if pd.api.types.is_float_dtype(dtype):
+            dtypes[column] = np.float64
+        elif pd.api.types.is_integer_dtype(dtype):
+            dtypes[column] = np.int64
+    return result.astype(dtypes) if dtypes else result
+
+
+class PandasEngine:
+    """Reference engine: pandas group-bys and the partition-based ranking.top_k"""
+
+    name = "pandas"
+
+    def filter(self, df, ranges, categories, index=None):
+        """Positions of the rows within ranges and categories
+
+        index is an optional FilterIndex over df, used when given.
+        """
+        if index is not None:
+            return index.positions(ranges, categories)
+        mask = np.ones(len(df), dtype=bool)
+        for column, (low, high) in ranges.items():
+            values = df[column].to_numpy()
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        for column, selected in categories.items():
+            mask &= df[column].isin(selected).to_numpy()
+        return np.flatnonzero(mask)
+
+    def aggregate(self, df, by, spec):
+        """df.groupby(by).agg(spec) over the groups that have rows"""
+        keys = _as_list(by)
+        metrics = [metric for metric in spec if metric not in keys]
+        # float32 scores are summed in float64, as by the other engines
+        frame = df[keys + metrics].astype(
+            {metric: np.float64 for metric in metrics if df[metric].dtype == np.float32}
+        )
+        return _normalized(frame.groupby(by, observed=True).agg(spec))
+
+    def top_k(self, df, columns, k, largest=True, ties="first"):
+        """Positions of the k best rows of every column, best first"""
+        return top_k(df[columns].to_numpy(), k, largest, ties)
+
+
+class PolarsEngine(PandasEngine):
+    """Multithreaded Polars engine; each frame is converted once and reused"""
+
+    name = "polars"
+
+    def __init__(self):
+        import polars
+
+        self.pl = polars
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def _table(self, df):
+        """df as a Polars frame, kept while df itself is alive"""
+        key = id(df)
+        with self._lock:
+            table = self._tables.get(key)
+        if table is None:
+            # Cached views are reused across reruns, so most calls hit
+            table = self.pl.from_pandas(df)
+            with self._lock:
+                self._tables[key] = table
+            weakref.finalize(df, self._tables.pop, key, None)
+        return table
+
+    def _expression(self, metric, stat):
+        column = self.pl.col(metric)
+        # pandas skips missing values in nunique and first
+        return {
+            "mean": column.mean(),
+            "sum": column.sum(),
+            "count": column.count(),
+            "std": column.std(),
+            "var": column.var(),
+            "min": column.min(),
+            "max": column.max(),
+            "median": column.median(),
+            "nunique": column.drop_nulls().n_unique(),
+            "first": column.drop_nulls().first(),
+        }[stat]
+
+    def filter(self, df, ranges, categories, index=None):
+        """Positions of the rows within ranges and categories"""
+        pl = self.pl
+        condition = pl.lit(True)
+        for column, (low, high) in ranges.items():
+            if low is not None:
+                condition &= pl.col(column) >= low
+            if high is not None:
+                condition &= pl.col(column) <= high
+        for column, selected in categories.items():
+            condition &= pl.col(column).cast(pl.Utf8).is_in(list(selected))
+        mask = self._table(df).select(condition.fill_null(False)).to_series()
+        return np.flatnonzero(mask.to_numpy())
+
+    def aggregate(self, df, by, spec):
+        """df.groupby(by).agg(spec) over the groups that have rows"""
+        keys = [by] if isinstance(by, str) else list(by)
+        flat = _is_flat(spec)
+        expressions, columns = [], []
+        for metric, stats in spec.items():
+            for stat in _as_list(stats):
+                expressions.append(
+                    self._expression(metric, stat).alias(f"c{len(columns)}")
+                )
+                columns.append(metric if flat else (metric, stat))
+        result = self._table(df).group_by(keys).agg(expressions).to_pandas()
+        result = _source_dtypes(result, df, keys)
+        result = result.set_index(keys if len(keys) > 1 else keys[0]).sort_index()
+        result.columns = columns if flat else pd.MultiIndex.from_tuples(columns)
+        return _normalized(_source_dtypes(result, df, _firsts(spec)))
+
+    def top_k(self, df, columns, k, largest=True, ties="first"):
+        """Positions of the k best rows of every column, best first"""
+        pl = self.pl
+        selected = []
+        for column in columns:
+            keys, tie, rows = _best_first(df[column], largest, ties)
+            ranked = (
+                pl.DataFrame({"key": keys, "tie": tie, "row": rows})
+                .lazy()
+                .sort(["key", "tie"])
+                .head(k)
+                .collect()
+            )
+            selected.append(ranked["row"].to_numpy())
+        return selected
+
+
+class DuckDBEngine(PandasEngine):
+    """In-process DuckDB engine scanning the pandas frames in place"""
+
+    name = "duckdb"
+
+    def __init__(self):
+        import duckdb
+
+        self._connection = duckdb.connect()
+        self._lock = threading.Lock()
+
+    def _query(self, sql, **frames):
+        """Result of sql over the given pandas frames, as a pandas frame"""
+        with self._lock:
+            cursor = self._connection.cursor()
+        try:
+            for name, frame in frames.items():
+                cursor.register(name, frame)
+            return cursor.execute(sql).df()
+        finally:
+            cursor.close()
+
+    def filter(self, df, ranges, categories, index=None):
+        """Positions of the rows within ranges and categories"""
+        conditions = []
+        for column, (low, high) in ranges.items():
+            if low is not None:
+                conditions.append(f"{quote_name(column)} >= {sql_literal(low)}")
+            if high is not None:
+                conditions.append(f"{quote_name(column)} <= {sql_literal(high)}")
+        for column, selected in categories.items():
+            values = ", ".join(sql_literal(str(value)) for value in selected)
+            conditions.append(
+                f"{quote_name(column)} IN ({values})" if values else "FALSE"
+            )
+        condition = " AND ".join(conditions) or "TRUE"
+        # Projections keep row order, so the mask lines up with df
+        mask = self._query(
+            f"SELECT coalesce({condition}, FALSE) AS keep FROM frame", frame=df
+        )
+        return np.flatnonzero(mask["keep"].to_numpy())
+
+    def aggregate(self, df, by, spec):
+        """df.groupby(by).agg(spec) over the groups that have rows"""
+        keys = [by] if isinstance(by, str) else list(by)
+        columns = keys + [metric for metric in spec if metric not in keys]
+        sql, labels = aggregate_sql(by, spec, "frame")
+        result = _source_dtypes(self._query(sql, frame=df[columns]), df, keys)
+        result = _source_dtypes(aggregate_frame(result, by, labels), df, _firsts(spec))
+        return _normalized(result)
+
+    def top_k(self, df, columns, k, largest=True, ties="first"):
+        """Positions of the k best rows of every column, best first"""
+        selected = []
+        for column in columns:
+            keys, tie, rows = _best_first(df[column], largest, ties)
+            scores = pd.DataFrame({"key": keys, "tie": tie, "row": rows})
+            ranked = self._query(
+                f"SELECT row FROM scores ORDER BY key, tie LIMIT {int(k)}",
+                scores=scores,
+            )
+            selected.append(ranked["row"].to_numpy())
+        return selected
+
+
+ENGINES = {
+    "pandas": PandasEngine,
+    "polars": PolarsEngine,
+    "duckdb": DuckDBEngine,
+}
+
+_instances = {}
+
+
+def get_engine(name):
+    """The shared engine instance registered under name"""
+    if name not in ENGINES:
+        raise ValueError(
+            f"unknown aggregation engine {name!r}, pick one of {list(ENGINES)}"
+        )
+    if name not in _instances:
+        try:
+            _instances[name] = ENGINES[name]()
+        except ImportError as error:
+            raise ImportError(
+                f"the {name} aggregation engine needs the {name} package: "
+                f"pip install {name}"
+            ) from error
+    return _instances[name]
@@ -0,0 +1,61 @@
+"""Chunked export of filtered rows to CSV, gzipped CSV or Parquet
+
+Rows are taken from the full dataset chunk by chunk and streamed to a
+binary file, so the filtered set never exists as one frame or one string.
+"""
+
+import zlib
+
+# label: (file suffix, MIME type)
+EXPORT_FORMATS = {
+    "CSV": (".csv", "text/csv"),
+    "CSV (gzip)": (".csv.gz", "application/gzip"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+
+def iter_chunks(df, positions, chunk_rows):
+    """Consecutive frames of df.iloc[positions], at most chunk_rows each"""
+    for start in range(0, max(len(positions), 1), chunk_rows):
+        yield df.iloc[positions[start : start + chunk_rows]]
+
+
+def iter_csv(df, positions, chunk_rows=100_000, compress=False):
+    """Encoded CSV of df.iloc[positions], yielded in chunks
+
+    With compress the chunks form one gzip stream.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    for index, chunk in enumerate(iter_chunks(df, positions, chunk_rows)):
+        data = chunk.to_csv(index=False, header=index == 0).encode("utf-8")
+        yield compressor.compress(data) if compressor else data
+    if compressor:
+        yield compressor.flush()
+
+
+def write_parquet(handle, df, positions, chunk_rows=100_000):
+    """Write df.iloc[positions] to a binary file as Parquet, one row group per chunk"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in iter_chunks(df, positions, chunk_rows):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(handle, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_export(handle, df, positions, label, chunk_rows=100_000):
+    """Stream df.iloc[positions] to a binary file in an EXPORT_FORMATS format"""
+    if label not in EXPORT_FORMATS:
+        raise ValueError(f"unknown export format {label!r}")
+    if label == "Parquet":
+        write_parquet(handle, df, positions, chunk_rows)
+        return
+    for data in iter_csv(df, positions, chunk_rows, compress=label == "CSV (gzip)"):
+        handle.write(data)
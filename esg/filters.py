@@ -0,0 +1,223 @@
+"""Sidebar filter state and the precomputed index answering it"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+
+class FilterState(
+    namedtuple(
+        "FilterState",
+        [
+            "years",
+            "industries",
+            "regions",
+            "min_esg",
+            "min_revenue",
+            "max_carbon",
+            "max_energy",
+            "min_growth",
+        ],
+    )
+):
+    """Canonical, hashable snapshot of every sidebar filter
+
+    Selections are sorted and numbers normalised, so equivalent widget
+    states (e.g. the same industries picked in another order) share one
+    cache key.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_widgets(
+        cls,
+        years,
+        industries,
+        regions,
+        min_esg,
+        min_revenue,
+        max_carbon,
+        max_energy,
+        min_growth,
+    ):
+        """Normalise raw widget values into a filter state"""
+        return cls(
+            years=(int(years[0]), int(years[1])),
+            industries=tuple(sorted(map(str, industries))),
+            regions=tuple(sorted(map(str, regions))),
+            min_esg=float(min_esg),
+            min_revenue=float(min_revenue),
+            max_carbon=float(max_carbon),
+            max_energy=float(max_energy),
+            min_growth=float(min_growth),
+        )
+
+    @property
+    def thresholds(self):
+        """The numeric performance filters, excluding the year range"""
+        return (
+            self.min_esg,
+            self.min_revenue,
+            self.max_carbon,
+            self.max_energy,
+            self.min_growth,
+        )
+
+    @property
+    def ranges(self):
+        """Numeric bounds in FilterIndex.positions form"""
+        return {
+            "Year": self.years,
+            "ESG_Overall": (self.min_esg, None),
+            "Revenue": (self.min_revenue, None),
+            "CarbonEmissions": (None, self.max_carbon),
+            "EnergyConsumption": (None, self.max_energy),
+            "GrowthRate": (self.min_growth, None),
+        }
+
+    @property
+    def categories(self):
+        """Category selections in FilterIndex.positions form"""
+        return {"Industry": self.industries, "Region": self.regions}
+
+
+class FilterIndex:
+    """Sorted numeric columns and category postings for one dataset
+
+    A query walks the most selective filter first (a searchsorted slice of a
+    sorted column, or the postings of the selected categories) and checks the
+    remaining filters only on those k candidate rows. Filters left at their
+    full range are skipped, so a typical slider move costs O(log n + k)
+    instead of one full-column scan per filter.
+    """
+
+    def __init__(self, df, range_columns, category_columns):
+        self.size = len(df)
+        position_dtype = np.int32 if self.size < 2**31 else np.int64
+
+        self._values, self._order, self._sorted, self._valid = {}, {}, {}, {}
+        for column in range_columns:
+            values = df[column].to_numpy()
+            order = np.argsort(values, kind="stable").astype(position_dtype)
+            self._values[column] = values
+            self._order[column] = order
+            # NaNs sort last and never satisfy a bound
+            self._sorted[column] = values[order]
+            self._valid[column] = int(np.count_nonzero(~pd.isna(values)))
+
+        self._codes, self._categories, self._options = {}, {}, {}
+        self._postings, self._offsets = {}, {}
+        for column in category_columns:
+            categorical = pd.Categorical(df[column])
+            codes = categorical.codes
+            self._codes[column] = codes
+            self._categories[column] = categorical.categories
+            # Categories in order of first appearance, like Series.unique()
+            self._options[column] = [
+                categorical.categories[code] for code in pd.unique(codes) if code >= 0
+            ]
+            self._postings[column] = np.argsort(codes, kind="stable").astype(
+                position_dtype
+            )
+            counts = np.bincount(
+                codes[codes >= 0], minlength=len(categorical.categories)
+            )
+            self._offsets[column] = np.concatenate(
+                [[np.count_nonzero(codes < 0)], counts]
+            ).cumsum()
+
+    def bounds(self, column):
+        """Smallest and largest non-missing value of a range column"""
+        valid = self._valid[column]
+        return self._sorted[column][0], self._sorted[column][valid - 1]
+
+    def options(self, column):
+        """Categories of a category column in order of first appearance"""
+        return list(self._options[column])
+
+    def _scalar(self, column, value):
+        """Bound in the column's dtype, so searchsorted does not upcast the column"""
+        dtype = self._sorted[column].dtype
+        if np.issubdtype(dtype, np.floating):
+            # Same rounding NumPy applies when comparing the column to a scalar
+            return dtype.type(value)
+        info = np.iinfo(dtype)
+        if float(value).is_integer() and info.min <= value <= info.max:
+            return dtype.type(value)
+        return value
+
+    def _range_slice(self, column, low, high):
+        """Span of the sorted column satisfying low <= value <= high"""
+        values = self._sorted[column]
+        start = 0
+        if low is not None:
+            start = int(np.searchsorted(values, self._scalar(column, low), "left"))
+        stop = self._valid[column]
+        if high is not None:
+            end = int(np.searchsorted(values, self._scalar(column, high), "right"))
+            stop = min(stop, end)
+        return start, max(start, stop)
+
+    def _category_codes(self, column, selected):
+        """Codes of the selected categories (unknown values are ignored)"""
+        indexer = self._categories[column].get_indexer(list(selected))
+        return np.unique(indexer[indexer >= 0])
+
+    def positions(self, ranges=None, categories=None):
+        """Sorted row positions matching every filter
+
+        ranges maps a numeric column to a (low, high) pair of inclusive
+        bounds, either of which may be None. categories maps a category
+        column to the allowed values.
+        """
+        candidates = []
+        for column, (low, high) in (ranges or {}).items():
+            if low is None and high is None:
+                continue
+            start, stop = self._range_slice(column, low, high)
+            if stop - start < self.size:
+                candidates.append((stop - start, "range", column, (start, stop)))
+
+        for column, selected in (categories or {}).items():
+            codes = self._category_codes(column, selected)
+            offsets = self._offsets[column]
+            count = int((offsets[codes + 1] - offsets[codes]).sum())
+            if count < self.size:
+                candidates.append((count, "category", column, codes))
+
+        if not candidates:
+            return np.arange(self.size)
+
+        # Drive the query from the most selective filter
+        candidates.sort(key=lambda candidate: candidate[0])
+        _, kind, column, spec = candidates[0]
+        if kind == "range":
+            rows = self._order[column][spec[0] : spec[1]]
+        else:
+            offsets, postings = self._offsets[column], self._postings[column]
+            rows = np.concatenate(
+                [postings[offsets[code] : offsets[code + 1]] for code in spec]
+                or [postings[:0]]
+            )
+
+        for _, kind, column, spec in candidates[1:]:
+            if len(rows) == 0:
+                break
+            if kind == "range":
+                low, high = ranges[column]
+                values = self._values[column][rows]
+                keep = np.ones(len(rows), dtype=bool)
+                if low is not None:
+                    keep &= values >= low
+                if high is not None:
+                    keep &= values <= high
+            else:
+                allowed = np.zeros(len(self._categories[column]), dtype=bool)
+                allowed[spec] = True
+                codes = self._codes[column][rows]
+                keep = (codes >= 0) & allowed[codes]
+            rows = rows[keep]
+
+        return np.sort(rows)
@@ -0,0 +1,149 @@
+"""Per-company ESG forecasts, fitted for every company at once
+
+Scores are laid out as a Company x Year matrix with NaN for missing years,
+and each model is an ordinary least squares line fitted to every row in one
+batch of masked column sums, without a per-company loop:
+
+- "linear": score = a + b * year
+- "exponential": log(score) = a + b * year, i.e. constant percentage growth
+- "ar1": score[t] = a + b * score[t - 1], iterated from the last known score
+
+fit_companies() returns a Fit holding the coefficients, so forecasts for any
+company, group or horizon are a vectorised evaluation.
+"""
+
+import warnings
+from collections import namedtuple
+
+import numpy as np
+
+FORECAST_MODELS = {
+    "linear": "Linear trend",
+    "exponential": "Exponential trend",
+    "ar1": "AR(1)",
+}
+
+# Coefficients per company (rows of companies); last_value and last_year are
+# each company's latest known score, rmse its in-sample error in score units
+Fit = namedtuple(
+    "Fit",
+    [
+        "model",
+        "companies",
+        "years",
+        "intercept",
+        "slope",
+        "last_value",
+        "last_year",
+        "rmse",
+    ],
+)
+
+
+def company_year_matrix(companies, years, values):
+    """Dense Company x Year matrix of values, NaN where a year is missing
+
+    Returns the sorted company ids, the consecutive years spanned and the
+    matrix; a repeated (company, year) keeps its last value.
+    """
+    ids, rows = np.unique(np.asarray(companies), return_inverse=True)
+    years = np.asarray(years, dtype=np.int64)
+    first = int(years.min()) if len(years) else 0
+    span = np.arange(first, int(years.max()) + 1 if len(years) else 0)
+    matrix = np.full((len(ids), len(span)), np.nan)
+    matrix[rows, years - first] = np.asarray(values, dtype=np.float64)
+    return ids, span, matrix
+
+
+def _least_squares(x, y):
+    """Per-row intercept and slope of y = a + b * x, over entries where both exist
+
+    Rows with fewer than two points, or no spread in x, get NaN.
+    """
+    x = np.broadcast_to(x, y.shape)
+    mask = np.isfinite(x) & np.isfinite(y)
+    x, y = np.where(mask, x, 0.0), np.where(mask, y, 0.0)
+    n = mask.sum(axis=1)
+    sx, sy = x.sum(axis=1), y.sum(axis=1)
+    sxx, sxy = (x * x).sum(axis=1), (x * y).sum(axis=1)
+    denominator = n * sxx - sx * sx
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (n * sxy - sx * sy) / denominator
+        intercept = (sy - slope * sx) / n
+    invalid = (n < 2) | ~(np.abs(denominator) > 1e-12)
+    slope[invalid] = np.nan
+    intercept[invalid] = np.nan
+    return intercept, slope
+
+
+def _last_known(matrix, years):
+    """Latest known value of every row and its year (NaN/-1 for empty rows)"""
+    known = np.isfinite(matrix)
+    last = matrix.shape[1] - 1 - np.argmax(known[:, ::-1], axis=1)
+    has_any = known.any(axis=1)
+    values = np.where(has_any, matrix[np.arange(len(matrix)), last], np.nan)
+    return values, np.where(has_any, years[last], -1)
+
+
+def _ar1_ahead(fit, steps):
+    """AR(1) value steps years after each company's last known score"""
+    a, b = fit.intercept[:, None], fit.slope[:, None]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        power = b**steps
+        # Closed form of k iterations, with the b = 1 limit a * k
+        drift = np.where(np.isclose(b, 1.0), a * steps, a * (1 - power) / (1 - b))
+        return power * fit.last_value[:, None] + drift
+
+
+def _evaluate(fit, years):
+    """Model values of every company at the given years (absolute)"""
+    years = np.asarray(years, dtype=np.float64)
+    if fit.model == "ar1":
+        steps = years[None, :] - fit.last_year[:, None]
+        return np.where(steps >= 0, _ar1_ahead(fit, np.maximum(steps, 0)), np.nan)
+    offset = years - fit.years[0]
+    line = fit.intercept[:, None] + fit.slope[:, None] * offset[None, :]
+    if fit.model == "exponential":
+        with np.errstate(over="ignore"):
+            return np.exp(line)
+    return line
+
+
+def fit_companies(companies, years, matrix, model="linear"):
+    """Fit model to every row of a company_year_matrix at once"""
+    if model not in FORECAST_MODELS:
+        raise ValueError(
+            f"unknown forecast model {model!r}, pick one of {list(FORECAST_MODELS)}"
+        )
+    offset = (years - years[0]).astype(np.float64)
+    if model == "linear":
+        intercept, slope = _least_squares(offset, matrix)
+    elif model == "exponential":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logs = np.where(matrix > 0, np.log(matrix), np.nan)
+        intercept, slope = _least_squares(offset, logs)
+    else:
+        intercept, slope = _least_squares(matrix[:, :-1], matrix[:, 1:])
+    last_value, last_year = _last_known(matrix, years)
+    result = Fit(model, companies, years, intercept, slope, last_value, last_year, None)
+
+    if model == "ar1":
+        # One-step-ahead predictions from each previous known score
+        fitted = np.full_like(matrix, np.nan)
+        fitted[:, 1:] = intercept[:, None] + slope[:, None] * matrix[:, :-1]
+    else:
+        fitted = _evaluate(result, years)
+    with warnings.catch_warnings():
+        # Companies without a fitted value have no error
+        warnings.simplefilter("ignore", RuntimeWarning)
+        rmse = np.sqrt(np.nanmean((fitted - matrix) ** 2, axis=1))
+    return result._replace(rmse=rmse)
+
+
+def forecast(fit, horizon):
+    """Forecast years after the data's last year, and every company's values
+
+    Returns (years, values) with values shaped (companies, horizon).
+    """
+    future = np.arange(fit.years[-1] + 1, fit.years[-1] + 1 + horizon)
+    return future, _evaluate(fit, future)
@@ -0,0 +1,270 @@
+"""Out-of-core queries over Parquet files through DuckDB
+
+The dataset is never loaded as a whole: filters and group-bys are pushed
+down to DuckDB, which scans the Parquet files in place within a fixed
+memory limit and spills to disk beyond it. Only aggregates and bounded row
+samples come back as pandas frames. DuckDB is an optional dependency,
+needed only with DATA_BACKEND=duckdb.
+"""
+
+import glob
+import math
+import numbers
+import tempfile
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from esg.data import COLUMNS, apply_schema, sidecar_is_current, sidecar_path
+
+# pandas aggregation names and the DuckDB expressions computing them
+AGGREGATES = {
+    "mean": "avg({})",
+    "sum": "sum({})",
+    "count": "count({})",
+    "std": "stddev_samp({})",
+    "var": "var_samp({})",
+    "min": "min({})",
+    "max": "max({})",
+    "median": "median({})",
+    "nunique": "count(DISTINCT {})",
+    "first": "first({})",
+}
+
+
+def _connect(memory_limit, threads=None):
+    try:
+        import duckdb
+    except ImportError as error:
+        raise ImportError(
+            "DATA_BACKEND=duckdb needs the duckdb package: pip install duckdb"
+        ) from error
+    settings = {"memory_limit": memory_limit}
+    if threads:
+        settings["threads"] = threads
+    return duckdb.connect(config=settings)
+
+
+def quote_name(name):
+    """Column name as a quoted SQL identifier"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_literal(value):
+    """SQL literal for a filter value"""
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    return repr(float(value))
+
+
+def parquet_files(path):
+    """Parquet files making up a dataset path: a file, a directory or a glob
+
+    A CSV path is converted once to its Parquet sidecar by DuckDB itself,
+    so the conversion is out of core as well.
+    """
+    path = str(path)
+    if any(char in path for char in "*?["):
+        files = sorted(glob.glob(path))
+    elif Path(path).is_dir():
+        files = sorted(str(file) for file in Path(path).rglob("*.parquet"))
+    elif Path(path).suffix == ".csv":
+        files = [str(_convert_csv(Path(path)))]
+    else:
+        files = [path]
+    if not files or not all(Path(file).exists() for file in files):
+        raise FileNotFoundError(path)
+    return files
+
+
+def _convert_csv(path):
+    sidecar = sidecar_path(path).with_suffix(".parquet")
+    if not path.exists():
+        return sidecar
+    if not sidecar_is_current(path, sidecar):
+        # Unique per call, so concurrent conversions never share a file
+        with tempfile.NamedTemporaryFile(
+            dir=sidecar.parent, prefix=f".{sidecar.name}.", suffix=".tmp", delete=False
+        ) as handle:
+            tmp = Path(handle.name)
+        try:
+            connection = _connect("1GB")
+            connection.execute(
+                f"COPY (SELECT * FROM read_csv_auto({sql_literal(str(path))})) "
+                f"TO {sql_literal(str(tmp))} (FORMAT PARQUET)"
+            )
+            connection.close()
+            tmp.replace(sidecar)
+        finally:
+            tmp.unlink(missing_ok=True)
+    return sidecar
+
+
+def aggregate_sql(by, spec, source, where="TRUE"):
+    """GROUP BY query computing spec per group of source, and its column labels"""
+    by = [by] if isinstance(by, str) else list(by)
+    flat = all(isinstance(stats, str) for stats in spec.values())
+    expressions, columns = [], []
+    for metric, stats in spec.items():
+        for stat in [stats] if isinstance(stats, str) else stats:
+            expressions.append(
+                AGGREGATES[stat].format(quote_name(metric)) + f" AS c{len(columns)}"
+            )
+            columns.append(metric if flat else (metric, stat))
+    keys = ", ".join(quote_name(column) for column in by)
+    sql = (
+        f"SELECT {keys}, {', '.join(expressions)} FROM {source} WHERE {where} "
+        f"GROUP BY {keys} ORDER BY {keys}"
+    )
+    return sql, columns
+
+
+def aggregate_frame(result, by, columns):
+    """An aggregate_sql result shaped like the pandas groupby().agg() result"""
+    by = [by] if isinstance(by, str) else list(by)
+    result = apply_schema(result).set_index(by if len(by) > 1 else by[0])
+    flat = not isinstance(columns[0], tuple)
+    result.columns = columns if flat else pd.MultiIndex.from_tuples(columns)
+    return result
+
+
+class DuckDBDataset:
+    """The ESG dataset queried in place, with the FilterIndex bounds/options API"""
+
+    def __init__(self, path, memory_limit="1GB", threads=None):
+        self.files = parquet_files(path)
+        self.version = ("duckdb",) + tuple(
+            (file, Path(file).stat().st_mtime_ns) for file in self.files
+        )
+        self._connection = _connect(memory_limit, threads)
+        self._lock = threading.Lock()
+        files = ", ".join(sql_literal(file) for file in self.files)
+        self._connection.execute(
+            f"CREATE VIEW esg AS SELECT * FROM read_parquet([{files}], "
+            "union_by_name=true)"
+        )
+        available = set(self.query("DESCRIBE esg")["column_name"])
+        self.columns = [column for column in COLUMNS if column in available]
+        self._bounds, self._options = {}, {}
+        self.size = int(self.query("SELECT count(*) AS n FROM esg")["n"].iloc[0])
+
+    def query(self, sql):
+        """Result of a query as a pandas frame"""
+        # Each thread gets its own cursor on the shared database
+        with self._lock:
+            cursor = self._connection.cursor()
+        try:
+            return cursor.execute(sql).df()
+        finally:
+            cursor.close()
+
+    def bounds(self, column):
+        """Smallest and largest non-missing value of a numeric column"""
+        if column not in self._bounds:
+            name = quote_name(column)
+            row = self.query(
+                f"SELECT min({name}) AS low, max({name}) AS high FROM esg "
+                f"WHERE NOT isnan({name}::DOUBLE)"
+            ).iloc[0]
+            self._bounds[column] = (row["low"], row["high"])
+        return self._bounds[column]
+
+    def options(self, column):
+        """Distinct values of a category column"""
+        if column not in self._options:
+            name = quote_name(column)
+            values = self.query(
+                f"SELECT DISTINCT {name} AS value FROM esg "
+                f"WHERE {name} IS NOT NULL ORDER BY 1"
+            )["value"]
+            self._options[column] = [str(value) for value in values]
+        return list(self._options[column])
+
+    def where(self, ranges=None, categories=None):
+        """SQL condition equivalent to FilterIndex.positions(ranges, categories)
+
+        Missing bounds are filled from the data, so NaN and NULL values fail
+        every filter, as they do in memory.
+        """
+        conditions = []
+        for column, (low, high) in (ranges or {}).items():
+            if low is None and high is None:
+                continue
+            data_low, data_high = self.bounds(column)
+            low = data_low if low is None else low
+            high = data_high if high is None else high
+            if isinstance(low, float) and math.isnan(low):
+                return "FALSE"
+            conditions.append(
+                f"{quote_name(column)} BETWEEN {sql_literal(low)} AND {sql_literal(high)}"
+            )
+        for column, selected in (categories or {}).items():
+            values = ", ".join(sql_literal(str(value)) for value in selected)
+            conditions.append(
+                f"{quote_name(column)} IN ({values})" if values else "FALSE"
+            )
+        return " AND ".join(conditions) or "TRUE"
+
+    def aggregate(self, by, spec, where="TRUE"):
+        """Grouped statistics of the matching rows, like groupby().agg(spec)
+
+        Only groups with rows are returned, in sorted order; columns are
+        flat when every spec value is a single statistic, else (metric,
+        statistic) pairs.
+        """
+        sql, columns = aggregate_sql(by, spec, "esg", where)
+        return aggregate_frame(self.query(sql), by, columns)
+
+    def count(self, where="TRUE"):
+        """Number of matching rows"""
+        return int(self.query(f"SELECT count(*) AS n FROM esg WHERE {where}")["n"][0])
+
+    def distinct(self, column, where="TRUE"):
+        """Number of distinct values of a column over the matching rows"""
+        name = quote_name(column)
+        return int(
+            self.query(f"SELECT count(DISTINCT {name}) AS n FROM esg WHERE {where}")[
+                "n"
+            ][0]
+        )
+
+    def mean(self, column, where="TRUE"):
+        """Mean of a column over the matching rows"""
+        name = quote_name(column)
+        return self.query(f"SELECT avg({name}) AS m FROM esg WHERE {where}")["m"][0]
+
+    def rows(self, columns, where="TRUE", limit=None, seed=0):
+        """Matching rows, or a uniform sample of at most limit rows
+
+        The seed only makes the sample reproducible on a single thread: with
+        more DuckDB threads the reservoir sees rows in varying order.
+        """
+        select = ", ".join(quote_name(column) for column in columns)
+        sql = f"SELECT {select} FROM esg WHERE {where}"
+        if limit is not None:
+            sql = (
+                f"SELECT * FROM ({sql}) USING SAMPLE reservoir({int(limit)} ROWS) "
+                f"REPEATABLE ({int(seed)})"
+            )
+        return apply_schema(self.query(sql))
+
+    def export(self, path, label, where="TRUE"):
+        """Write the matching rows to a file straight from DuckDB"""
+        options = {
+            "CSV": "FORMAT CSV, HEADER",
+            "CSV (gzip)": "FORMAT CSV, HEADER, COMPRESSION GZIP",
+            "Parquet": "FORMAT PARQUET",
+        }[label]
+        columns = ", ".join(quote_name(column) for column in self.columns)
+        with self._lock:
+            cursor = self._connection.cursor()
+        try:
+            cursor.execute(
+                f"COPY (SELECT {columns} FROM esg WHERE {where}) "
+                f"TO {sql_literal(str(path))} ({options})"
+            )
+        finally:
+            cursor.close()
@@ -0,0 +1,119 @@
+"""Dense Company x Year x Metric panel of the dataset
+
+The long-format rows are scattered once into a float64 array with one cell
+per company and year (NaN where a company has no row that year). Per-year
+statistics of any selection of rows are then reductions over the company
+axis, and year-over-year changes are differences along the year axis,
+instead of hash group-bys of the long frame.
+"""
+
+import numpy as np
+import pandas as pd
+
+from esg.cube import moment_statistics
+
+
+class Panel:
+    """values[company, year, metric] of every company, NaN where missing
+
+    Industry and Region codes are kept per (company, year) cell as well, so
+    per-year statistics can be split by either without the long frame.
+    """
+
+    def __init__(self, df, metrics, categories=("Industry", "Region")):
+        self.metrics = list(metrics)
+        self.companies, rows = np.unique(
+            df["CompanyID"].to_numpy(), return_inverse=True
+        )
+        years = df["Year"].to_numpy().astype(np.int64)
+        self.years = np.arange(years.min(), years.max() + 1).astype(df["Year"].dtype)
+        self.shape = (len(self.companies), len(self.years))
+        # Flat (company, year) cell of every dataset row
+        self._cells = rows * len(self.years) + (years - years.min())
+
+        self.values = np.full(self.shape + (len(self.metrics),), np.nan)
+        self.values.reshape(-1, len(self.metrics))[self._cells] = df[
+            self.metrics
+        ].to_numpy(dtype=np.float64)
+
+        self.codes, self.categories = {}, {}
+        for column in categories:
+            categorical = pd.Categorical(df[column])
+            codes = np.full(self.shape[0] * self.shape[1], -1, dtype=np.int16)
+            codes[self._cells] = categorical.codes
+            self.codes[column] = codes.reshape(self.shape)
+            self.categories[column] = categorical.categories
+
+    def matrix(self, metric):
+        """Company x Year matrix of one metric (a view, NaN where missing)"""
+        return self.values[..., self.metrics.index(metric)]
+
+    def cells(self, positions):
+        """Company x Year mask of the cells holding the given dataset rows"""
+        mask = np.zeros(self.shape[0] * self.shape[1], dtype=bool)
+        mask[self._cells[positions]] = True
+        return mask.reshape(self.shape)
+
+    def yearly(self, spec, mask=None, by=None):
+        """Per-year statistics of the masked cells, like groupby().agg(spec)
+
+        Grouped by Year, or by Year and one category column (by). spec maps
+        metrics to "count", "sum", "mean", "var" or "std" (or a list of
+        them). Only years (and categories) holding selected rows appear.
+        """
+        if mask is None:
+            mask = np.ones(self.shape, dtype=bool)
+        if by is None:
+            groups = mask.sum(axis=0)
+        else:
+            codes = self.codes[by]
+            mask = mask & (codes >= 0)
+            categories = self.categories[by]
+            # One group per (year, category), year-major like groupby
+            group = np.arange(len(self.years)) * len(categories) + codes
+            group = group[mask]
+            size = len(self.years) * len(categories)
+            groups = np.bincount(group, minlength=size)
+
+        count, total, sumsq = (np.zeros((groups.size, len(spec))) for _ in range(3))
+        for position, metric in enumerate(spec):
+            values = self.matrix(metric)
+            valid = mask & ~np.isnan(values)
+            if by is None:
+                values = np.where(valid, values, 0)
+                count[:, position] = valid.sum(axis=0)
+                total[:, position] = values.sum(axis=0)
+                sumsq[:, position] = (values * values).sum(axis=0)
+            else:
+                values = values[mask]
+                present = valid[mask]
+                weights = np.where(present, values, 0)
+                count[:, position] = np.bincount(group, present, size)
+                total[:, position] = np.bincount(group, weights, size)
+                sumsq[:, position] = np.bincount(group, weights * weights, size)
+
+        keep = groups.ravel() > 0
+        if by is None:
+            index = pd.Index(self.years, name="Year")
+        else:
+            index = pd.MultiIndex.from_product(
+                [self.years, categories], names=["Year", by]
+            )
+        return moment_statistics(
+            count[keep], total[keep], sumsq[keep], spec, index[keep]
+        )
+
+
+def year_over_year(values, percent=False):
+    """Change of each year's value from the previous year (NaN for the first)
+
+    values has years on its last axis; percent gives the change in percent.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    change = np.full(values.shape, np.nan)
+    previous = values[..., :-1]
+    change[..., 1:] = values[..., 1:] - previous
+    if percent:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change[..., 1:] = change[..., 1:] / previous * 100
+    return change
@@ -0,0 +1,173 @@
+"""Chart-side data reduction: what is sent to the browser, not what is analysed"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+SAMPLING_METHODS = ("stratified", "density", "none")
+
+
+def _quotas(sizes, budget):
+    """Split budget across groups in proportion to their sizes
+
+    Every non-empty group keeps at least one point; leftover points go to
+    the largest remainders, and no group is given more than it holds.
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    total = int(sizes.sum())
+    if total <= budget:
+        return sizes
+    share = sizes * budget / total
+    quotas = np.minimum(np.maximum(np.floor(share).astype(np.int64), 1), sizes)
+    spare = budget - int(quotas.sum())
+    if spare > 0:
+        order = np.argsort(-(share - np.floor(share)), kind="stable")
+        for group in order:
+            if spare == 0:
+                break
+            if quotas[group] < sizes[group]:
+                quotas[group] += 1
+                spare -= 1
+    return quotas
+
+
+def _density_pick(x, y, quota, rng, bins):
+    """Positions of quota points, drawn round-robin over a bins x bins grid
+
+    Sparse cells are kept whole while dense cells are thinned, so outliers
+    and the shape of the cloud survive a small budget.
+    """
+    cells = np.zeros(len(x), dtype=np.int64)
+    for values in (x, y):
+        values = np.nan_to_num(values.astype(np.float64), nan=np.nanmin(values))
+        low, high = values.min(), values.max()
+        scale = bins / (high - low) if high > low else 0.0
+        cells = cells * bins + np.minimum(
+            ((values - low) * scale).astype(np.int64), bins - 1
+        )
+    # Integer part orders, the random fraction breaks ties: one argsort each
+    noise = rng.random(len(x))
+    order = np.argsort(cells + noise)
+    sorted_cells = cells[order]
+    starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+    run = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    rank_in_cell = np.empty(len(x), dtype=np.int64)
+    rank_in_cell[order] = np.arange(len(order)) - run
+    return np.argpartition(rank_in_cell + noise, quota - 1)[:quota]
+
+
+def downsample(
+    df, budget, by="Industry", method="stratified", x=None, y=None, seed=0, bins=48
+):
+    """At most budget rows of df, representative within each by group
+
+    "stratified" draws a uniform sample per group, "density" thins the
+    dense regions of each group's x/y cloud first, and "none" returns df
+    unchanged. Groups keep their share of the rows, and the seed makes the
+    same view sample the same points on every rerun.
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"method must be one of {SAMPLING_METHODS}")
+    if method == "none" or len(df) <= budget:
+        return df
+
+    codes = pd.Categorical(df[by]).codes.astype(np.int64)
+    groups, inverse, sizes = np.unique(codes, return_inverse=True, return_counts=True)
+    quotas = _quotas(sizes, budget)
+    rng = np.random.default_rng(seed)
+    members = np.argsort(inverse, kind="stable")
+    bounds = np.r_[0, np.cumsum(sizes)]
+
+    keep = []
+    for group, quota in enumerate(quotas):
+        rows = members[bounds[group] : bounds[group + 1]]
+        if quota >= len(rows):
+            keep.append(rows)
+        elif method == "stratified":
+            keep.append(rng.choice(rows, quota, replace=False))
+        else:
+            picked = _density_pick(
+                df[x].to_numpy()[rows], df[y].to_numpy()[rows], quota, rng, bins
+            )
+            keep.append(rows[picked])
+    return df.iloc[np.sort(np.concatenate(keep))]
+
+
+def render_mode(points, webgl_threshold):
+    """Plotly Express render_mode: WebGL once a chart has many points"""
+    return "webgl" if points > webgl_threshold else "svg"
+
+
+def box_summary(values, max_outliers=100):
+    """Quartiles, Tukey whiskers, mean/sd and a capped outlier sample
+
+    Quartiles use numpy's default linear interpolation, so they can differ
+    slightly from a box Plotly computes itself from the raw values. Whiskers
+    reach the furthest values within 1.5 IQR of the box. Outliers beyond max_outliers are thinned evenly by value, always keeping
+    the extremes.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return None
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outliers = np.sort(values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)])
+    if len(outliers) > max_outliers:
+        picks = np.linspace(0, len(outliers) - 1, max_outliers).round().astype(int)
+        outliers = outliers[np.unique(picks)]
+    return {
+        "q1": q1,
+        "median": median,
+        "q3": q3,
+        "lowerfence": inside.min(),
+        "upperfence": inside.max(),
+        "mean": values.mean(),
+        "sd": values.std(ddof=1) if len(values) > 1 else 0.0,
+        "count": len(values),
+        "outliers": outliers,
+    }
+
+
+def box_traces(summaries, colors):
+    """Box traces drawn from box_summary results, one box per name
+
+    Only the summary numbers and the outlier sample reach the browser, so
+    the payload does not grow with the number of rows.
+    """
+    traces = []
+    for (name, summary), color in zip(summaries.items(), colors):
+        if summary is None:
+            continue
+        traces.append(
+            go.Box(
+                x=[name],
+                q1=[summary["q1"]],
+                median=[summary["median"]],
+                q3=[summary["q3"]],
+                lowerfence=[summary["lowerfence"]],
+                upperfence=[summary["upperfence"]],
+                mean=[summary["mean"]],
+                sd=[summary["sd"]],
+                boxmean="sd",
+                boxpoints=False,
+                name=name,
+                legendgroup=name,
+                marker_color=color,
+            )
+        )
+        if len(summary["outliers"]):
+            traces.append(
+                go.Scatter(
+                    x=[name] * len(summary["outliers"]),
+                    y=summary["outliers"],
+                    mode="markers",
+                    name=name,
+                    legendgroup=name,
+                    showlegend=False,
+                    marker=dict(color=color, size=4),
+                    hovertemplate="%{y}<extra>" + str(name) + "</extra>",
+                )
+            )
+    return traces
@@ -0,0 +1,108 @@
+"""Opt-in wall-time and memory profiling of the steps of one script run
+
+A Profiler is activated for the current thread (Streamlit runs each session
+in its own script thread), and instrumented code calls the module-level
+step() helper, which does nothing while no profiler is active.
+Memory deltas come from tracemalloc, which traces the whole process: under
+concurrent sessions they include other sessions' allocations.
+"""
+
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+_local = threading.local()
+
+
+class Profiler:
+    """Wall time and traced memory delta of every step of one run"""
+
+    def __init__(self, run, page=None, trace_memory=True):
+        self.run = run
+        self.page = page
+        self.trace_memory = trace_memory
+        self.records = []
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._depth = 0
+
+    def _memory(self):
+        return tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+
+    def _add(self, name, kind, seconds, memory_delta):
+        self.records.append(
+            {
+                "run": self.run,
+                "page": self.page,
+                "step": name,
+                "kind": kind,
+                "depth": self._depth,
+                "wall_ms": round(seconds * 1000, 3),
+                "memory_delta_mb": round(memory_delta / 1024**2, 3),
+            }
+        )
+
+    @contextmanager
+    def step(self, name, kind="data"):
+        """Time the enclosed block as one step"""
+        start, memory = time.perf_counter(), self._memory()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            end, after = time.perf_counter(), self._memory()
+            self._add(name, kind, end - start, after - memory)
+
+    def record(self, name, seconds, kind="data"):
+        """Add a step timed elsewhere, such as on a worker thread
+
+        Its memory delta is not known and recorded as 0.
+        """
+        self._add(name, kind, seconds, 0)
+
+    def frame(self):
+        """Steps as a table, slowest first"""
+        columns = {
+            "step": "Step",
+            "kind": "Kind",
+            "wall_ms": "Wall (ms)",
+            "memory_delta_mb": "Memory Δ (MB)",
+        }
+        if not self.trace_memory:
+            del columns["memory_delta_mb"]
+        if not self.records:
+            return pd.DataFrame(columns=list(columns.values()))
+        table = pd.DataFrame(self.records)[list(columns)].rename(columns=columns)
+        return table.sort_values("Wall (ms)", ascending=False, ignore_index=True)
+
+    def write_jsonl(self, path):
+        """Append the steps to a JSON lines file, one object per step"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(timezone.utc).isoformat()
+        with path.open("a", encoding="utf-8") as handle:
+            for record in self.records:
+                handle.write(json.dumps({"timestamp": timestamp, **record}) + "\n")
+
+
+def activate(profiler):
+    """Make profiler the current thread's profiler (None deactivates)"""
+    _local.profiler = profiler
+
+
+def current():
+    """The current thread's active profiler, if any"""
+    return getattr(_local, "profiler", None)
+
+
+def step(name, kind="data"):
+    """Profile the enclosed block when profiling is active"""
+    profiler = current()
+    return profiler.step(name, kind) if profiler else nullcontext()
@@ -0,0 +1,74 @@
+"""Top-k selection over several score columns at once
+
+np.partition finds the k-th best score of every column in one O(n) pass,
+so only the rows at or above that cut-off are ever sorted. A leaderboard
+over a million companies therefore sorts k rows per dimension rather than
+ranking the whole universe.
+"""
+
+import numpy as np
+import pandas as pd
+
+TIE_BREAKS = ("first", "last")
+
+
+def tie_order(ties, size):
+    """Priority of every row among equal scores (lower wins)"""
+    if isinstance(ties, str):
+        if ties not in TIE_BREAKS:
+            raise ValueError(f"ties must be one of {TIE_BREAKS} or an array of keys")
+        order = np.arange(size)
+        return order if ties == "first" else order[::-1]
+    keys = np.asarray(ties)
+    if len(keys) != size:
+        raise ValueError("tie-break keys must have one entry per row")
+    # Larger keys win, in any sortable dtype such as names (by their sorted
+    # codes; missing keys get -1 and lose); equal keys fall back to row order
+    codes, _ = pd.factorize(keys, sort=True)
+    priority = np.empty(size, dtype=np.int64)
+    priority[np.argsort(-codes, kind="stable")] = np.arange(size)
+    return priority
+
+
+def top_k(scores, k, largest=True, ties="first"):
+    """Positions of the k best rows of each score column, best first
+
+    scores is a 1-D array or an (n, d) matrix of d score columns. Equal
+    scores are ordered by ties: "first" or "last" row position, or an array
+    of per-row keys where the larger key wins. Missing scores are never
+    selected, so a column with fewer than k valid scores returns fewer
+    positions. Returns one array for 1-D input, else a list of d arrays.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    single = scores.ndim == 1
+    matrix = scores[:, None] if single else scores
+    size, width = matrix.shape
+    k = max(0, min(int(k), size))
+    if k == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty if single else [empty] * width
+
+    valid = ~np.isnan(matrix)
+    keys = np.where(valid, -matrix if largest else matrix, np.inf)
+    tie = tie_order(ties, size)
+
+    # k-th best key of every column in a single partition
+    cutoff = np.partition(keys, k - 1, axis=0)[k - 1]
+    selected = []
+    for column in range(width):
+        key = keys[:, column]
+        candidates = np.flatnonzero((key <= cutoff[column]) & valid[:, column])
+        order = np.lexsort((tie[candidates], key[candidates]))[:k]
+        selected.append(candidates[order])
+    return selected[0] if single else selected
+
+
+def competition_ranks(values, largest=True):
+    """1-based "1224" ranks of already sorted best-first values
+
+    Ranks of a top_k selection equal their ranks in the full column, since
+    every strictly better row is itself selected.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    keys = -values if largest else values
+    return np.searchsorted(keys, keys, side="left") + 1
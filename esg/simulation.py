@@ -0,0 +1,39 @@
+"""Vectorised ESG trajectory projections over many scenarios at once
+
+A scenario is a baseline score and an annual improvement rate. Baselines
+(the filtered average, every industry or every company) and rate grids are
+projected in one NumPy broadcast, and a fan chart summarises the resulting
+paths by percentiles across scenarios.
+"""
+
+import numpy as np
+
+# Percentile bands of a fan chart, outermost first, plus its centre line
+FAN_BANDS = ((10, 90), (25, 75))
+FAN_CENTRE = 50
+
+
+def project(baselines, rates, horizon):
+    """Compound-growth paths of every baseline under every annual rate
+
+    baselines and rates (in percent) broadcast against each other, e.g. a
+    column of company baselines against a row of rates. The result has
+    their broadcast shape plus a last axis of horizon + 1 years, the first
+    of which is the baseline itself.
+    """
+    baselines = np.asarray(baselines, dtype=np.float64)
+    growth = 1 + np.asarray(rates, dtype=np.float64) / 100
+    return baselines[..., None] * growth[..., None] ** np.arange(horizon + 1)
+
+
+def fan(paths):
+    """Percentiles of paths across scenarios, by FAN_BANDS and FAN_CENTRE
+
+    paths is (scenarios, ..., years); every leading scenario axis is pooled.
+    Returns {percentile: values per year}, ignoring missing baselines.
+    """
+    paths = np.asarray(paths, dtype=np.float64)
+    paths = paths.reshape(-1, paths.shape[-1])
+    levels = sorted({level for band in FAN_BANDS for level in band} | {FAN_CENTRE})
+    values = np.nanpercentile(paths, levels, axis=0)
+    return dict(zip(levels, values))
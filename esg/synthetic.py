@@ -0,0 +1,218 @@
+"""Seedable synthetic ESG datasets for demos and load testing
+
+Every quantity is drawn as a whole (company x year) array, so generating a
+million companies costs a handful of NumPy calls per chunk rather than a
+Python loop per row. Usage::
+
+    python -m esg.synthetic data/esg_1m.parquet --companies 1000000
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from esg.data import COLUMNS, apply_schema
+
+DEFAULT_YEARS = range(2015, 2026)
+
+DEFAULT_REGIONS = [
+    "Africa",
+    "Asia",
+    "Europe",
+    "Latin America",
+    "Middle East",
+    "North America",
+    "Oceania",
+]
+
+# Median revenue ($M), carbon intensity (tons per $M) and mean ESG score,
+# roughly matching esg_financial_dataset.csv
+INDUSTRY_PROFILES = {
+    "Consumer Goods": (1500, 170, 55),
+    "Energy": (5600, 950, 49),
+    "Finance": (3700, 10, 64),
+    "Healthcare": (2900, 75, 58),
+    "Manufacturing": (1450, 275, 50),
+    "Retail": (1100, 80, 56),
+    "Technology": (7400, 30, 63),
+    "Transportation": (800, 590, 47),
+    "Utilities": (1050, 700, 52),
+}
+
+DEFAULT_INDUSTRIES = list(INDUSTRY_PROFILES)
+
+
+def _profiles(industries, rng):
+    """Profile arrays for the requested industries, drawing unknown ones"""
+    profiles = np.array(
+        [
+            INDUSTRY_PROFILES.get(
+                name,
+                (
+                    rng.uniform(800, 7500),
+                    rng.uniform(10, 950),
+                    rng.uniform(47, 64),
+                ),
+            )
+            for name in industries
+        ],
+        dtype=np.float64,
+    )
+    return profiles[:, 0], profiles[:, 1], profiles[:, 2]
+
+
+def _generate_block(first_id, companies, years, industries, regions, profiles, rng):
+    """Generate one block of consecutive companies"""
+    n_years = len(years)
+    median_revenue, carbon_intensity, esg_mean = profiles
+    industry = rng.integers(len(industries), size=companies)
+    region = rng.integers(len(regions), size=companies)
+    t = np.arange(n_years, dtype=np.float64)
+
+    # Revenue compounds from a log-normal base; growth is derived from it
+    base = np.exp(rng.normal(np.log(median_revenue[industry]), 0.9))
+    rates = rng.normal(5.0, 8.0, (companies, n_years)).clip(-36, 38)
+    rates[:, 0] = 0.0
+    revenue = np.round(
+        (base[:, None] * np.cumprod(1 + rates / 100, axis=1)).clip(min=1.0), 1
+    )
+    growth = np.full_like(revenue, np.nan)
+    growth[:, 1:] = np.round((revenue[:, 1:] / revenue[:, :-1] - 1) * 100, 1)
+
+    margin = np.round(rng.normal(10.9, 8.7, (companies, n_years)).clip(-20, 50), 1)
+    valuation = rng.lognormal(0.5, 0.7, companies)[:, None]
+    market_cap = np.round(revenue * valuation, 1)
+
+    # Pillar scores: company baseline + steady improvement + yearly noise
+    pillars = (
+        rng.normal(esg_mean[industry, None], 10.0, (companies, 3))[:, None, :]
+        + rng.normal(0.65, 0.3, (companies, 1, 3)) * t[None, :, None]
+        + rng.normal(0.0, 1.5, (companies, n_years, 3))
+    )
+    pillars = np.round(pillars.clip(0, 100), 1)
+    overall = np.round(pillars.mean(axis=2), 1)
+
+    carbon = np.round(
+        revenue
+        * carbon_intensity[industry, None]
+        * rng.lognormal(0.0, 0.5, companies)[:, None]
+        * (1 - 0.01 * t),
+        1,
+    ).clip(min=0.1)
+    water = np.round(carbon * rng.uniform(1 / 6, 4 / 3, companies)[:, None], 1)
+    energy = np.round(carbon * rng.uniform(2.0, 50 / 3, companies)[:, None], 1)
+
+    ids = np.arange(first_id, first_id + companies)
+    df = pd.DataFrame(
+        {
+            "CompanyID": np.repeat(ids, n_years),
+            "CompanyName": np.repeat([f"Company_{i}" for i in ids], n_years),
+            "Industry": pd.Categorical.from_codes(
+                np.repeat(industry, n_years), categories=industries
+            ),
+            "Region": pd.Categorical.from_codes(
+                np.repeat(region, n_years), categories=regions
+            ),
+            "Year": np.tile(np.asarray(years), companies),
+            "Revenue": revenue.ravel(),
+            "ProfitMargin": margin.ravel(),
+            "MarketCap": market_cap.ravel(),
+            "GrowthRate": growth.ravel(),
+            "ESG_Overall": overall.ravel(),
+            "ESG_Environmental": pillars[:, :, 0].ravel(),
+            "ESG_Social": pillars[:, :, 1].ravel(),
+            "ESG_Governance": pillars[:, :, 2].ravel(),
+            "CarbonEmissions": carbon.ravel(),
+            "WaterUsage": water.ravel(),
+            "EnergyConsumption": energy.ravel(),
+        },
+        columns=COLUMNS,
+    )
+    return apply_schema(df)
+
+
+def iter_dataset(
+    companies=1000,
+    years=DEFAULT_YEARS,
+    industries=DEFAULT_INDUSTRIES,
+    regions=DEFAULT_REGIONS,
+    seed=None,
+    chunk_size=100_000,
+):
+    """Yield the dataset in blocks of at most chunk_size companies"""
+    years, industries, regions = list(years), list(industries), list(regions)
+    sequence = np.random.SeedSequence(seed)
+    profiles = _profiles(industries, np.random.default_rng(sequence))
+    children = sequence.spawn(-(-companies // chunk_size))
+    for first, child in zip(range(0, companies, chunk_size), children):
+        size = min(chunk_size, companies - first)
+        rng = np.random.default_rng(child)
+        yield _generate_block(
+            first + 1, size, years, industries, regions, profiles, rng
+        )
+
+
+def generate_dataset(companies=1000, years=DEFAULT_YEARS, **kwargs):
+    """Synthetic frame with the schema of esg_financial_dataset.csv"""
+    blocks = list(iter_dataset(companies, years, **kwargs))
+    df = pd.concat(blocks, ignore_index=True) if len(blocks) > 1 else blocks[0]
+    return apply_schema(df)
+
+
+# Formats write_dataset can produce (CSV compression follows the suffix)
+WRITE_SUFFIXES = (".csv", ".csv.gz", ".parquet")
+
+
+def write_dataset(path, companies=1000, years=DEFAULT_YEARS, **kwargs):
+    """Generate a dataset straight to a WRITE_SUFFIXES file, one block at a time"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    if not path.name.endswith(WRITE_SUFFIXES):
+        raise ValueError(f"dataset path must end in one of {WRITE_SUFFIXES}")
+    writer = None
+    try:
+        for index, block in enumerate(iter_dataset(companies, years, **kwargs)):
+            if path.suffix == ".parquet":
+                # Plain strings keep the schema identical across blocks
+                block = block.astype({"CompanyName": str})
+                table = pa.Table.from_pandas(block, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+            else:
+                mode, header = ("w", True) if index == 0 else ("a", False)
+                block.to_csv(path, mode=mode, header=header, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help="destination .csv, .csv.gz or .parquet file")
+    parser.add_argument("--companies", type=int, default=1000)
+    parser.add_argument("--start-year", type=int, default=DEFAULT_YEARS.start)
+    parser.add_argument("--end-year", type=int, default=DEFAULT_YEARS.stop - 1)
+    parser.add_argument("--industries", help="comma-separated industry names")
+    parser.add_argument("--regions", help="comma-separated region names")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    options = {"seed": args.seed, "chunk_size": args.chunk_size}
+    if args.industries:
+        options["industries"] = args.industries.split(",")
+    if args.regions:
+        options["regions"] = args.regions.split(",")
+    years = range(args.start_year, args.end_year + 1)
+    write_dataset(args.output, args.companies, years, **options)
+    print(f"Wrote {args.companies * len(years):,} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Cold-start import report for the dashboard
+
+Runs the module-level imports of app.py in a fresh interpreter under
+``python -X importtime`` and summarises where the time goes: the total, the
+slowest top-level packages and the slowest individual modules. With
+--budget-ms the script exits non-zero when the total exceeds the budget, so
+it can guard startup time in CI. Usage::
+
+    python scripts/importtime_report.py --top 15 --budget-ms 2500
+"""
+
+import argparse
+import ast
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def app_imports(path=ROOT / "app.py"):
+    """Source of the top-level import statements of a script"""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    return "\n".join(
+        ast.unparse(node)
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+
+def measure(code):
+    """(module, self_us, cumulative_us, depth) for every import made by code"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def summarise(rows, top=10):
+    """Total, per-package and per-module import times in milliseconds"""
+    packages = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        packages[name.split(".")[0]] += self_us
+    slowest = sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+    return {
+        "total_ms": round(sum(row[1] for row in rows) / 1000, 1),
+        "modules": len(rows),
+        "packages": {
+            name: round(us / 1000, 1)
+            for name, us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+        },
+        "slowest_modules": {name: round(us / 1000, 1) for name, us, _, _ in slowest},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=10, help="rows per table")
+    parser.add_argument("--budget-ms", type=float, help="fail above this total")
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    parser.add_argument("--runs", type=int, default=3, help="keep the fastest run")
+    args = parser.parse_args(argv)
+
+    code = app_imports()
+    report = min(
+        (summarise(measure(code), args.top) for _ in range(args.runs)),
+        key=lambda summary: summary["total_ms"],
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"Cold import of app.py: {report['total_ms']:.0f} ms, "
+            f"{report['modules']} modules"
+        )
+        print("\nBy package (ms):")
+        for name, ms in report["packages"].items():
+            print(f"  {name:<30}{ms:>10.1f}")
+        print("\nSlowest modules (self ms):")
+        for name, ms in report["slowest_modules"].items():
+            print(f"  {name:<50}{ms:>10.1f}")
+
+    if args.budget_ms is not None and report["total_ms"] > args.budget_ms:
+        print(
+            f"\nOver budget: {report['total_ms']:.0f} ms > {args.budget_ms:.0f} ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
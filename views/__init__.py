@@ -0,0 +1,79 @@
+"""Dashboard pages, registered by name and imported only when first shown
+
+Each page is a module with a ``render(ctx)`` function taking a
+views.context.PageContext. Adding a page means adding its module and one
+PAGES entry; the other pages neither import nor run its code.
+"""
+
+import importlib
+import threading
+import time
+from collections import defaultdict, deque, namedtuple
+
+import numpy as np
+import pandas as pd
+
+from esg.data import COLUMNS
+
+# module: dotted module path; columns: dataset columns the page reads on top of
+# the sidebar filter columns
+Page = namedtuple("Page", ["module", "columns"])
+
+PAGES = {
+    "Overview": Page("views.overview", COLUMNS),
+    "Industry Analysis": Page(
+        "views.industry",
+        [
+            "CompanyID",
+            "ESG_Environmental",
+            "ESG_Social",
+            "ESG_Governance",
+            "WaterUsage",
+        ],
+    ),
+    "Regional Insights": Page(
+        "views.regional",
+        ["ESG_Environmental", "ESG_Social", "ESG_Governance", "WaterUsage"],
+    ),
+    "Trends Over Time": Page(
+        "views.trends",
+        ["CompanyID", "ESG_Environmental", "ESG_Social", "ESG_Governance"],
+    ),
+    "Key Insights": Page("views.insights", ["CompanyName"]),
+    "Recommendations": Page("views.recommendations", []),
+}
+
+
+def render_page(name, ctx):
+    """Render a registered page, returning its execution time in seconds"""
+    module = importlib.import_module(PAGES[name].module)
+    start = time.perf_counter()
+    module.render(ctx)
+    return time.perf_counter() - start
+
+
+class PageTimings:
+    """Recent render times of every page, shared by all sessions"""
+
+    def __init__(self, window=200):
+        self._times = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            self._times[name].append(seconds)
+
+    def summary(self):
+        """Runs, last, median and p95 render time (ms) per page"""
+        with self._lock:
+            times = {name: np.array(runs) * 1000 for name, runs in self._times.items()}
+        rows = {
+            name: {
+                "Runs": len(ms),
+                "Last (ms)": ms[-1],
+                "Median (ms)": np.median(ms),
+                "p95 (ms)": np.percentile(ms, 95),
+            }
+            for name, ms in times.items()
+        }
+        return pd.DataFrame.from_dict(rows, orient="index").round(1)
@@ -0,0 +1,587 @@
+"""Shared data resources and the per-rerun context handed to every page"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from esg import config, profiling
+from esg.cache import LRUCache, fingerprint
+from esg.cube import CUBE_STATISTICS, DIMENSIONS, Cube
+from esg.data import METRIC_COLUMNS, DatasetStore
+from esg.derived import DERIVED_METRICS
+from esg.forecast import company_year_matrix, fit_companies
+from esg.engines import get_engine
+from esg.filters import FilterIndex
+from esg.panel import Panel
+from esg.plotting import downsample, render_mode
+from views.theme import get_chart_theme
+
+# Columns every rerun needs for the sidebar filters
+RANGE_FILTER_COLUMNS = [
+    "Year",
+    "ESG_Overall",
+    "Revenue",
+    "CarbonEmissions",
+    "EnergyConsumption",
+    "GrowthRate",
+]
+CATEGORY_FILTER_COLUMNS = ["Industry", "Region"]
+FILTER_COLUMNS = RANGE_FILTER_COLUMNS + CATEGORY_FILTER_COLUMNS
+
+# Metrics held in the Company x Year panel for the time-series charts
+PANEL_METRICS = [
+    "ESG_Overall",
+    "ESG_Environmental",
+    "ESG_Social",
+    "ESG_Governance",
+    "Revenue",
+    "CarbonEmissions",
+    "EnergyConsumption",
+]
+# Statistics of every panel metric in the shared yearly summary
+YEARLY_SUMMARY_STATISTICS = ["mean", "std", "count"]
+
+
+# ============================================================================
+# SHARED RESOURCES (built once per process, reused by every page and session)
+# ============================================================================
+@st.cache_resource
+def get_dataset_store():
+    """Process-wide store over the columnar copy of the dataset"""
+    return DatasetStore(config.DATA_PATH, config.DELTA_DIR)
+
+
+def load_data(columns=None, keep=True):
+    """Load and cache the ESG dataset (only the requested columns are read)
+
+    Returns the frame together with a version key for caches derived from it.
+    With keep=False, columns read for this call are not added to the cache.
+    """
+    try:
+        store = get_dataset_store()
+        return store.frame(columns, keep), store.version
+    except OSError:
+        return load_sample_data(), "sample"
+
+
+@st.cache_resource
+def load_sample_data():
+    """Synthetic dataset used when no data file is available"""
+    # Only needed without a data file, so kept off the startup import path
+    from esg.synthetic import generate_dataset
+
+    return generate_dataset(
+        companies=50,
+        industries=["Retail", "Technology", "Healthcare", "Finance", "Energy"],
+        regions=["North America", "Europe", "Asia", "Latin America"],
+        seed=42,
+    )
+
+
+@st.cache_resource(show_spinner="Opening ESG dataset...")
+def get_duckdb_dataset(path):
+    """Process-wide DuckDB view over the Parquet file(s) at path"""
+    # Only needed in out-of-core mode, so kept off the startup import path
+    from esg.outofcore import DuckDBDataset
+
+    return DuckDBDataset(path, config.DUCKDB_MEMORY_LIMIT)
+
+
+def load_dataset():
+    """The out-of-core dataset, reopened when its files change"""
+    from esg.outofcore import parquet_files
+
+    dataset = get_duckdb_dataset(config.DATA_PATH)
+    files = parquet_files(config.DATA_PATH)
+    if (
+        tuple((file, os.stat(file).st_mtime_ns) for file in files)
+        != dataset.version[1:]
+    ):
+        get_duckdb_dataset.clear()
+        dataset = get_duckdb_dataset(config.DATA_PATH)
+    return dataset
+
+
+@st.cache_resource
+def get_view_cache():
+    """LRU cache of filtered views, bounded by VIEW_CACHE_MB"""
+    return LRUCache(config.VIEW_CACHE_MB * 1024**2)
+
+
+@st.cache_resource
+def get_figure_cache():
+    """LRU cache of chart figure dicts, bounded by FIGURE_CACHE_MB"""
+    return LRUCache(config.FIGURE_CACHE_MB * 1024**2)
+
+
+@st.cache_resource
+def get_aggregation_pool():
+    """Thread pool shared by all sessions for a page's independent aggregations"""
+    return ThreadPoolExecutor(
+        max_workers=config.AGGREGATION_THREADS, thread_name_prefix="esg-aggregate"
+    )
+
+
+# Older dataset versions are dropped once a delta has been merged
+@st.cache_resource(show_spinner="Indexing ESG dataset...", max_entries=2)
+def get_filter_index(version, _df):
+    """Filter index for one dataset version, shared by all sessions"""
+    return FilterIndex(_df, RANGE_FILTER_COLUMNS, CATEGORY_FILTER_COLUMNS)
+
+
+# Kept for the current dataset version only, like the filter index; no
+# spinner, since parallel() tasks reach it from pool threads
+@st.cache_resource(show_spinner=False, max_entries=len(DERIVED_METRICS))
+def get_derived_column(version, name, _df):
+    """A row-wise derived metric over every row of one dataset version"""
+    return DERIVED_METRICS[name].compute(_df).to_numpy()
+
+
+# Kept for the current dataset version only, like the filter index
+@st.cache_resource(show_spinner="Building ESG panel...", max_entries=2)
+def get_panel(version):
+    """Company x Year x Metric panel of one dataset version, shared by all sessions"""
+    panel_df, _ = load_data(
+        ["CompanyID", "Year"] + CATEGORY_FILTER_COLUMNS + PANEL_METRICS
+    )
+    return Panel(panel_df, PANEL_METRICS)
+
+
+@st.cache_resource(max_entries=16)
+def get_forecast_fit(version, metric, model, _panel):
+    """Per-company forecast model of a metric over every row of one dataset version"""
+    matrix = _panel.matrix(metric).astype(float)
+    return fit_companies(_panel.companies, _panel.years, matrix, model)
+
+
+def _fit_forecast(df, metric, model):
+    companies, years, matrix = company_year_matrix(
+        df["CompanyID"].to_numpy(), df["Year"].to_numpy(), df[metric].to_numpy()
+    )
+    return fit_companies(companies, years, matrix, model)
+
+
+class CubeSlot:
+    """The process's current cube, with the dataset version it describes"""
+
+    def __init__(self):
+        self.cube = None
+        self.version = None
+        self.ranges = None
+        self.lock = threading.Lock()
+
+
+@st.cache_resource
+def get_cube_slot():
+    """Cube shared by all sessions, updated as the dataset changes"""
+    return CubeSlot()
+
+
+def get_cube(version, index, ranges):
+    """Year x Industry x Region cube over the rows kept by the default thresholds
+
+    When the dataset only gained deltas since the current cube was built,
+    just the cells of the years those deltas touch are recomputed.
+    """
+    # Years are chosen per query, so a new year must not count as new ranges
+    ranges = {column: bounds for column, bounds in ranges.items() if column != "Year"}
+    slot = get_cube_slot()
+    with slot.lock:
+        if slot.version == version and slot.ranges == ranges:
+            return slot.cube
+        cube_df, _ = load_data(FILTER_COLUMNS + METRIC_COLUMNS)
+        years = None
+        if slot.cube is not None and slot.ranges == ranges and version != "sample":
+            years = get_dataset_store().changed_years(slot.version)
+        cube = slot.cube if years == set() else None
+        if years:
+            # Only the rows of the changed years are aggregated
+            year_ranges = {**ranges, "Year": (min(years), max(years))}
+            cube = slot.cube.with_years(
+                cube_df.iloc[index.positions(year_ranges)], years
+            )
+        if cube is None:
+            with st.spinner("Aggregating ESG dataset..."):
+                cube = Cube(cube_df.iloc[index.positions(ranges)], METRIC_COLUMNS)
+        slot.cube, slot.version, slot.ranges = cube, version, ranges
+        return cube
+
+
+# ============================================================================
+# PAGE CONTEXT
+# ============================================================================
+class PageContext:
+    """Dataset, filter state and filtered view of one rerun
+
+    Built once by app.py after the sidebar, then passed to the selected
+    page, so pages share the view and the cached aggregates instead of
+    recomputing them.
+    """
+
+    def __init__(self, df, data_version, filter_index, filter_state, default_state):
+        self.df = df
+        self.data_version = data_version
+        self.filter_index = filter_index
+        self.filter_state = filter_state
+        self.default_state = default_state
+        # Filtered views are shared read-only across pages and sessions
+        self.filtered_positions, self.filtered_df = get_view_cache().get_or_compute(
+            (data_version, tuple(df.columns), filter_state), self._filtered_view
+        )
+        self.row_count = len(self.filtered_df)
+
+    def _filtered_view(self):
+        """Row positions and rows of df matching the sidebar filters"""
+        with profiling.step("filtered view"):
+            positions = self.engine.filter(
+                self.df,
+                self.filter_state.ranges,
+                self.filter_state.categories,
+                self.filter_index,
+            )
+            view = self.df.iloc[positions]
+            # Plotly Express fails on categories with no rows, so drop filtered-out ones
+            with pd.option_context("mode.chained_assignment", None):
+                for column in view.select_dtypes("category").columns:
+                    view[column] = view[column].cat.remove_unused_categories()
+        return positions, view
+
+    def cached(self, key, compute):
+        """compute() for the current view, shared through the view cache
+
+        key names the result (a string, or a tuple starting with one, to add
+        the settings the result depends on).
+        """
+        name = key if isinstance(key, str) else key[0]
+        with profiling.step(name):
+            return get_view_cache().get_or_compute(
+                (self.data_version, key, self.filter_state), compute
+            )
+
+    @property
+    def engine(self):
+        """The configured aggregation engine (esg.engines)"""
+        return get_engine(config.AGGREGATION_ENGINE)
+
+    def dataset_mean(self, column):
+        """Mean of a column over the whole, unfiltered dataset"""
+        return self.df[column].mean()
+
+    def distinct_count(self, column):
+        """Number of distinct values of a column in the filtered data"""
+        return self.filtered_df[column].nunique()
+
+    def derived(self, name):
+        """A derived metric (esg.derived) as a Series aligned with filtered_df
+
+        Row-wise metrics are computed once over the whole dataset and only
+        gathered at the filtered positions, so filtered_df is never copied or
+        extended. Out of core, there is no whole dataset in memory, and every
+        metric is computed on the filtered sample.
+        """
+        metric = DERIVED_METRICS[name]
+
+        def compute():
+            if metric.per_view or self.df is None:
+                return metric.compute(self.filtered_df).rename(name)
+            values = get_derived_column(self.data_version, name, self.df)
+            return pd.Series(
+                values[self.filtered_positions],
+                index=self.filtered_df.index,
+                name=name,
+            )
+
+        return self.cached(("derived", name), compute)
+
+    def cube(self):
+        """The shared cube over the default-threshold rows"""
+        return get_cube(self.data_version, self.filter_index, self.default_state.ranges)
+
+    def panel(self):
+        """The shared Company x Year panel of PANEL_METRICS"""
+        return get_panel(self.data_version)
+
+    def parallel(self, tasks):
+        """Start independent computations concurrently, returning their futures
+
+        tasks maps names to argument-less callables, which run on the shared
+        aggregation pool and must not draw anything. Their time is profiled
+        per task, and an exception surfaces from the future's result(), where
+        the page uses it. Pandas and NumPy release the GIL in their inner
+        loops, Polars and DuckDB (AGGREGATION_ENGINE) throughout, so the
+        tasks overlap rather than taking turns.
+        """
+        if config.AGGREGATION_THREADS <= 1:
+            futures = {}
+            for name, task in tasks.items():
+                futures[name] = future = Future()
+                try:
+                    with profiling.step(name):
+                        future.set_result(task())
+                except Exception as error:
+                    future.set_exception(error)
+            return futures
+        if self.filter_state.thresholds == self.default_state.thresholds:
+            # Built here first, so that no worker draws the cube's spinner
+            self.cube()
+        # Likewise for the panel behind yearly()
+        self.panel()
+        script_ctx, profiler = get_script_run_ctx(), profiling.current()
+
+        def run(name, task):
+            # Lets tasks use Streamlit caches, which look up the session
+            add_script_run_ctx(threading.current_thread(), script_ctx)
+            start = time.perf_counter()
+            try:
+                return task()
+            finally:
+                if profiler is not None:
+                    profiler.record(name, time.perf_counter() - start, "parallel")
+
+        pool = get_aggregation_pool()
+        return {name: pool.submit(run, name, task) for name, task in tasks.items()}
+
+    def forecast_fit(self, metric, model):
+        """Per-company forecast coefficients (esg.forecast) of a metric
+
+        Fitted once per dataset version on every company's full history, so
+        filters only choose which companies a page reads. Out of core, the
+        fit uses the filtered sample.
+        """
+        with profiling.step(f"forecast fit {metric} ({model})"):
+            if self.df is None:
+                return self.cached(
+                    ("forecast fit", metric, model),
+                    lambda: _fit_forecast(self.filtered_df, metric, model),
+                )
+            return get_forecast_fit(self.data_version, metric, model, self.panel())
+
+    def grouped(self, by, spec, years=None):
+        """Profiled _grouped(), see there"""
+        with profiling.step(f"groupby {by}: {', '.join(spec)}"):
+            result = self._grouped(by, spec, years)
+        # Scores are stored as float32, which cannot hold values rounded to
+        # two decimals; aggregates are float64 on every path, as from the cube
+        return result.astype(
+            {
+                column: "float64"
+                for column, dtype in result.dtypes.items()
+                if dtype == "float32"
+            }
+        )
+
+    def _grouped(self, by, spec, years=None):
+        """filtered_df.groupby(by).agg(spec), answered from the cube when possible
+
+        The cube is used while the performance thresholds are at their defaults,
+        i.e. when only the year range, industries and regions narrow the data,
+        and by only names cube dimensions.
+        Statistics the cube does not hold (such as nunique) and active
+        thresholds fall back to the filtered rows. years optionally narrows the
+        filtered year range further.
+        """
+        filter_state = self.filter_state
+        years = tuple(years or filter_state.years)
+        view = self.filtered_df
+        if years != filter_state.years:
+            view = view[view["Year"].between(*years)]
+        by_columns = [by] if isinstance(by, str) else list(by)
+        if filter_state.thresholds != self.default_state.thresholds or not set(
+            by_columns
+        ) <= set(DIMENSIONS):
+            return self.engine.aggregate(view, by, spec)
+
+        def as_list(stats):
+            return [stats] if isinstance(stats, str) else list(stats)
+
+        flat = all(isinstance(stats, str) for stats in spec.values())
+        cube_spec = {
+            metric: stats if flat else as_list(stats)
+            for metric, stats in spec.items()
+            if set(as_list(stats)) <= CUBE_STATISTICS
+        }
+        result = self.cube().aggregate(
+            by, cube_spec, years, filter_state.industries, filter_state.regions
+        )
+        for metric, stats in spec.items():
+            if metric not in cube_spec:
+                raw = self.engine.aggregate(view, by, {metric: as_list(stats)})
+                for stat in as_list(stats):
+                    result[metric if flat else (metric, stat)] = raw[
+                        (metric, stat)
+                    ].to_numpy()
+
+        keys = [
+            metric if flat else (metric, stat)
+            for metric, stats in spec.items()
+            for stat in as_list(stats)
+        ]
+        return result[keys]
+
+    def yearly_summary(self):
+        """Per-year mean, std and count of every PANEL_METRICS metric
+
+        Computed together in one step per filter state and shared by every
+        yearly() series without a split, on every page. Out of core, it is a
+        single query.
+        """
+        spec = dict.fromkeys(PANEL_METRICS, YEARLY_SUMMARY_STATISTICS)
+        panel = self.panel()
+        if panel is None:
+            return self.grouped("Year", spec)
+        return self.cached(
+            "yearly summary", lambda: panel.yearly(spec, self._panel_cells(panel))
+        )
+
+    def _panel_cells(self, panel):
+        """The panel cells holding the filtered rows"""
+        return self.cached("panel cells", lambda: panel.cells(self.filtered_positions))
+
+    def yearly(self, spec, by=None):
+        """grouped("Year", spec), or grouped(["Year", by], spec), from the panel
+
+        Series in the yearly summary are selected from it. Other per-year
+        statistics of the filtered companies are reductions over the panel's
+        company axis, with the filtered rows as a mask of its cells. Metrics
+        or statistics the panel does not hold fall back to grouped().
+        """
+        keys = ["Year"] + ([by] if by else [])
+        flat = all(isinstance(stats, str) for stats in spec.values())
+        columns = [
+            (metric, stat)
+            for metric, stats in spec.items()
+            for stat in ([stats] if isinstance(stats, str) else stats)
+        ]
+        statistics = {stat for _, stat in columns}
+        if (
+            by is None
+            and set(spec) <= set(PANEL_METRICS)
+            and statistics <= set(YEARLY_SUMMARY_STATISTICS)
+        ):
+            result = self.yearly_summary()[columns]
+            if flat:
+                result.columns = list(spec)
+            return result
+        panel = self.panel()
+        if (
+            panel is None
+            or not set(spec) <= set(panel.metrics)
+            or not statistics <= CUBE_STATISTICS
+            or (by is not None and by not in panel.codes)
+        ):
+            return self.grouped(keys if by else "Year", spec)
+        cells = self._panel_cells(panel)
+        with profiling.step(f"panel {', '.join(keys)}: {', '.join(spec)}"):
+            return panel.yearly(spec, cells, by)
+
+    def scatter_points(self, x, y, by="Industry"):
+        """Rows of filtered_df to plot as an x/y scatter, and the render mode"""
+        filtered_df = self.filtered_df
+        with profiling.step(f"downsample {x} vs {y}"):
+            points = downsample(
+                filtered_df,
+                config.SCATTER_POINT_BUDGET,
+                by,
+                config.SCATTER_SAMPLING,
+                x,
+                y,
+            )
+        if len(points) < len(filtered_df):
+            st.caption(
+                f"Showing {len(points):,} of {len(filtered_df):,} points "
+                f"({config.SCATTER_SAMPLING} sample per {by})"
+            )
+        return points, render_mode(len(points), config.SCATTER_WEBGL_THRESHOLD)
+
+
+class OutOfCoreContext(PageContext):
+    """PageContext over a DuckDBDataset, for datasets larger than RAM
+
+    Aggregates, counts and means run as SQL over all matching rows. Row-level
+    views (filtered_df: distributions, scatter plots, quartiles) are a
+    uniform sample of at most OUT_OF_CORE_SAMPLE_ROWS matching rows.
+    """
+
+    def __init__(self, dataset, columns, filter_state, default_state):
+        self.df = None
+        self.dataset = dataset
+        self.data_version = dataset.version
+        self.filter_index = dataset
+        self.filter_state = filter_state
+        self.default_state = default_state
+        self.where = dataset.where(filter_state.ranges, filter_state.categories)
+        self.filtered_positions = None
+        self.row_count = self.cached("count", lambda: dataset.count(self.where))
+        self.filtered_df = get_view_cache().get_or_compute(
+            (self.data_version, tuple(columns), filter_state), self._sample(columns)
+        )
+        if len(self.filtered_df) < self.row_count:
+            st.sidebar.caption(
+                f"Out-of-core mode: row-level charts use a sample of "
+                f"{len(self.filtered_df):,} of {self.row_count:,} matching rows"
+            )
+
+    def _sample(self, columns):
+        def compute():
+            with profiling.step("filtered sample"):
+                return self.dataset.rows(
+                    list(dict.fromkeys(columns)),
+                    self.where,
+                    limit=config.OUT_OF_CORE_SAMPLE_ROWS,
+                )
+
+        return compute
+
+    def cube(self):
+        """No cube out of core: every aggregate is a query"""
+        return None
+
+    def panel(self):
+        """No panel out of core: yearly() runs as a query"""
+        return None
+
+    def dataset_mean(self, column):
+        """Mean of a column over the whole, unfiltered dataset"""
+        return self.cached(("dataset mean", column), lambda: self.dataset.mean(column))
+
+    def distinct_count(self, column):
+        """Number of distinct values of a column in the filtered data"""
+        return self.cached(
+            ("distinct", column), lambda: self.dataset.distinct(column, self.where)
+        )
+
+    def _grouped(self, by, spec, years=None):
+        """filtered rows grouped by by and aggregated by spec, in SQL"""
+        where = self.where
+        if years is not None and tuple(years) != self.filter_state.years:
+            ranges = {**self.filter_state.ranges, "Year": tuple(years)}
+            where = self.dataset.where(ranges, self.filter_state.categories)
+        return get_view_cache().get_or_compute(
+            (self.data_version, "sql", repr(by), repr(spec), where),
+            lambda: self.dataset.aggregate(by, spec, where),
+        )
+
+
+def show_cached_chart(name, build, *inputs):
+    """st.plotly_chart(build(*inputs)) at full width, cached as a figure dict
+
+    inputs are everything the figure depends on: the aggregates it plots and
+    its parameters. The figure dict is cached under a fingerprint of name,
+    inputs and the chart theme, so an unchanged chart skips build() (figure
+    construction and apply_chart_theme) on later reruns and in other
+    sessions.
+    """
+    key = fingerprint(name, inputs, get_chart_theme())
+
+    def compute():
+        with profiling.step(name, kind="build"):
+            return build(*inputs).to_dict()
+
+    figure = get_figure_cache().get_or_compute(key, compute)
+    with profiling.step(name, kind="send"):
+        st.plotly_chart(figure, use_container_width=True)
@@ -0,0 +1,205 @@
+"""Industry Analysis page: ESG and environmental comparison of industries"""
+
+import itertools
+
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from esg import config
+from esg.plotting import box_summary, box_traces
+from views.context import show_cached_chart
+from views.theme import apply_chart_theme
+
+
+def render(ctx):
+    """Render the Industry Analysis page"""
+    filtered_df = ctx.filtered_df
+    grouped = ctx.grouped
+
+    st.title("Industry-wise ESG Performance")
+    st.markdown(
+        "<p style='font-size: 1.125rem; color: #718096; margin-bottom: 2rem;'>Comparative analysis across industry sectors</p>",
+        unsafe_allow_html=True,
+    )
+
+    # Industry comparison
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Average ESG Scores by Industry")
+        industry_esg = grouped(
+            "Industry",
+            dict.fromkeys(
+                ["ESG_Overall", "ESG_Environmental", "ESG_Social", "ESG_Governance"],
+                "mean",
+            ),
+        )
+
+        def industry_scores(industry_esg):
+            fig = go.Figure()
+            colors = ["#3182ce", "#48bb78", "#ed8936", "#9f7aea"]
+            for idx, col in enumerate(industry_esg.columns):
+                fig.add_trace(
+                    go.Bar(
+                        name=col.replace("ESG_", ""),
+                        x=industry_esg.index,
+                        y=industry_esg[col],
+                        text=industry_esg[col].round(1),
+                        textposition="auto",
+                        marker_color=colors[idx],
+                    )
+                )
+
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                barmode="group",
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+                legend=dict(
+                    orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
+                ),
+            )
+            return fig
+
+        show_cached_chart("industry ESG scores", industry_scores, industry_esg)
+
+    with col2:
+        st.markdown("#### Revenue Distribution by Industry")
+        summaries = ctx.cached(
+            "revenue_distribution",
+            lambda: {
+                industry: box_summary(revenue, config.BOX_OUTLIER_SAMPLE)
+                for industry, revenue in filtered_df.groupby("Industry", observed=True)[
+                    "Revenue"
+                ]
+            },
+        )
+
+        def revenue_distribution(summaries):
+            fig = go.Figure(
+                box_traces(
+                    summaries,
+                    itertools.cycle(
+                        ["#3182ce", "#48bb78", "#ed8936", "#9f7aea", "#f56565"]
+                    ),
+                )
+            )
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+                showlegend=False,
+            )
+            return fig
+
+        show_cached_chart(
+            "industry revenue distribution", revenue_distribution, summaries
+        )
+
+    st.markdown("---")
+
+    # Carbon emissions by industry
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Carbon Emissions by Industry")
+        industry_carbon = grouped("Industry", {"CarbonEmissions": "mean"})[
+            "CarbonEmissions"
+        ].sort_values(ascending=True)
+
+        def carbon_by_industry(industry_carbon):
+            fig = go.Figure(
+                go.Bar(
+                    x=industry_carbon.values,
+                    y=industry_carbon.index,
+                    orientation="h",
+                    marker=dict(
+                        color=industry_carbon.values, colorscale="Reds", showscale=True
+                    ),
+                    text=industry_carbon.values.round(0),
+                    textposition="auto",
+                )
+            )
+
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+                xaxis_title="Average Carbon Emissions",
+                yaxis_title="Industry",
+            )
+            return fig
+
+        show_cached_chart(
+            "carbon emissions by industry", carbon_by_industry, industry_carbon
+        )
+
+    with col2:
+        st.markdown("#### Growth Rate vs ESG by Industry")
+        industry_summary = grouped(
+            "Industry",
+            {"GrowthRate": "mean", "ESG_Overall": "mean", "Revenue": "sum"},
+        ).reset_index()
+
+        def growth_vs_esg(industry_summary):
+            fig = px.scatter(
+                industry_summary,
+                x="GrowthRate",
+                y="ESG_Overall",
+                size="Revenue",
+                color="Industry",
+                text="Industry",
+                color_discrete_sequence=[
+                    "#3182ce",
+                    "#48bb78",
+                    "#ed8936",
+                    "#9f7aea",
+                    "#f56565",
+                ],
+            )
+            fig.update_traces(textposition="top center")
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+            )
+            return fig
+
+        show_cached_chart("growth vs ESG by industry", growth_vs_esg, industry_summary)
+
+    st.markdown("---")
+
+    # Detailed industry table
+    st.markdown("### Detailed Industry Statistics")
+
+    industry_stats = grouped(
+        "Industry",
+        {
+            "ESG_Overall": ["mean", "std"],
+            "Revenue": ["mean", "sum"],
+            "CarbonEmissions": "mean",
+            "WaterUsage": "mean",
+            "EnergyConsumption": "mean",
+            "GrowthRate": "mean",
+            "CompanyID": "nunique",
+        },
+    ).round(2)
+
+    industry_stats.columns = [
+        "ESG Avg",
+        "ESG Std",
+        "Revenue Avg",
+        "Revenue Total",
+        "Carbon Avg",
+        "Water Avg",
+        "Energy Avg",
+        "Growth Rate",
+        "Companies",
+    ]
+
+    st.dataframe(
+        industry_stats.style.background_gradient(cmap="RdYlGn", subset=["ESG Avg"]),
+        use_container_width=True,
+        height=300,
+    )
@@ -0,0 +1,183 @@
+"""Key Insights page: the headline findings and their supporting charts"""
+
+import plotly.express as px
+import streamlit as st
+
+from views.context import show_cached_chart
+from views.theme import apply_chart_theme
+
+
+def render(ctx):
+    """Render the Key Insights page"""
+    grouped = ctx.grouped
+    scatter_points = ctx.scatter_points
+
+    st.title("Key Insights from ESG Analysis")
+    st.markdown(
+        "<p style='font-size: 1.125rem; color: #718096; margin-bottom: 2rem;'>Data-driven discoveries and strategic implications</p>",
+        unsafe_allow_html=True,
+    )
+
+    # Insight 1
+    st.markdown(
+        "<div class='insight-card'><h3>INSIGHT 1: Carbon Emissions and ESG Performance</h3><p><strong>Finding:</strong> Companies with lower carbon emissions demonstrate significantly higher ESG overall scores, with a correlation coefficient indicating a moderate negative relationship.</p><p><strong>Implication:</strong> Reducing carbon footprint is a critical lever for improving overall ESG performance. Companies in high-emission industries face greater challenges but also have more opportunities for improvement.</p></div>",
+        unsafe_allow_html=True,
+    )
+
+    # Visualization for Insight 1
+    points, mode = scatter_points("CarbonEmissions", "ESG_Overall")
+
+    def carbon_vs_esg(points, mode):
+        fig = px.scatter(
+            points,
+            x="CarbonEmissions",
+            y="ESG_Overall",
+            color="Industry",
+            size="Revenue",
+            hover_data=["CompanyName", "Year"],
+            render_mode=mode,
+            color_discrete_sequence=[
+                "#3182ce",
+                "#48bb78",
+                "#ed8936",
+                "#9f7aea",
+                "#f56565",
+            ],
+        )
+        fig = apply_chart_theme(fig, title="Carbon Emissions vs ESG Overall Score")
+        fig.update_layout(
+            height=400,
+            margin=dict(l=20, r=20, t=40, b=20),
+        )
+        return fig
+
+    show_cached_chart("carbon vs ESG", carbon_vs_esg, points, mode)
+
+    st.markdown("---")
+
+    # Insight 2
+    st.markdown(
+        "<div class='insight-card'><h3>INSIGHT 2: Industry Variations in Sustainability Performance</h3><p><strong>Finding:</strong> Significant variations exist across industries, with some sectors consistently outperforming others in environmental metrics while maintaining competitive financial performance.</p><p><strong>Implication:</strong> Industry-specific benchmarks and best practices need to be established. Cross-industry learning opportunities exist, particularly in resource efficiency techniques.</p></div>",
+        unsafe_allow_html=True,
+    )
+
+    # Visualization for Insight 2
+    col1, col2 = st.columns(2)
+
+    with col1:
+        industry_comparison = grouped(
+            "Industry",
+            {"ESG_Overall": "mean", "CarbonEmissions": "mean", "Revenue": "mean"},
+        ).reset_index()
+
+        def industry_scores(industry_comparison):
+            fig = px.bar(
+                industry_comparison.sort_values("ESG_Overall", ascending=False),
+                x="Industry",
+                y="ESG_Overall",
+                color="CarbonEmissions",
+                color_continuous_scale="Reds",
+                text="ESG_Overall",
+            )
+            fig.update_traces(texttemplate="%{text:.1f}", textposition="outside")
+            fig = apply_chart_theme(
+                fig, title="Industry ESG Scores (colored by Carbon)"
+            )
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+            )
+            return fig
+
+        show_cached_chart(
+            "industry ESG scores by carbon", industry_scores, industry_comparison
+        )
+
+    with col2:
+
+        def revenue_vs_esg(industry_comparison):
+            # Create scatter plot
+            fig = px.scatter(
+                industry_comparison,
+                x="Revenue",
+                y="ESG_Overall",
+                size="CarbonEmissions",
+                color="Industry",
+                text="Industry",
+                color_discrete_sequence=[
+                    "#3182ce",
+                    "#48bb78",
+                    "#ed8936",
+                    "#9f7aea",
+                    "#f56565",
+                ],
+            )
+
+            # Calculate correlation coefficient
+            correlation = industry_comparison["Revenue"].corr(
+                industry_comparison["ESG_Overall"]
+            )
+            correlation_text = f"Correlation: {correlation:.2f}"
+
+            # Update layout with correlation info
+            fig.add_annotation(
+                text=correlation_text,
+                xref="paper",
+                yref="paper",
+                x=0.02,
+                y=0.98,
+                showarrow=False,
+                font=dict(size=12),
+            )
+
+            fig.update_traces(textposition="top center", selector=dict(type="scatter"))
+            fig = apply_chart_theme(fig, title="Revenue vs ESG by Industry")
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+            )
+            return fig
+
+        show_cached_chart(
+            "revenue vs ESG by industry", revenue_vs_esg, industry_comparison
+        )
+
+    st.markdown("---")
+
+    # Insight 3
+    st.markdown(
+        "<div class='insight-card'><h3>INSIGHT 3: Positive Temporal Trends in Sustainability</h3><p><strong>Finding:</strong> ESG scores have shown consistent improvement from 2015 to 2025, with environmental scores demonstrating the most significant growth trajectory.</p><p><strong>Implication:</strong> Corporate awareness and action on sustainability issues are increasing. This trend suggests that regulatory pressure, investor demands, and public awareness are driving positive change.</p></div>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # Insight 4
+    st.markdown(
+        "<div class='insight-card'><h3>INSIGHT 4: Regional Leadership in Sustainability</h3><p><strong>Finding:</strong> Certain regions consistently outperform others in ESG metrics, suggesting different regulatory environments, cultural priorities, and access to sustainable technologies.</p><p><strong>Implication:</strong> Regional best practices should be documented and shared. Policy harmonization and technology transfer can help bridge regional gaps in sustainability performance.</p></div>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # Insight 5
+    st.markdown(
+        "<div class='insight-card'><h3>INSIGHT 5: The Sustainability-Profitability Nexus</h3><p><strong>Finding:</strong> High ESG scores do not necessitate sacrificing financial performance. Many companies demonstrate that sustainability and profitability can coexist.</p><p><strong>Implication:</strong> The sustainability vs. profits dichotomy is false. Companies should view ESG investments as strategic opportunities rather than regulatory burdens.</p></div>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # Insight 6
+    st.markdown(
+        "<div class='insight-card'><h3>INSIGHT 6: Integrated Resource Management Opportunities</h3><p><strong>Finding:</strong> Strong correlations exist between water usage, energy consumption, and carbon emissions, suggesting opportunities for integrated resource management strategies.</p><p><strong>Implication:</strong> Companies should adopt holistic approaches to resource efficiency. Improvements in one area often yield benefits in others, creating multiplicative sustainability gains.</p></div>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # Insight 7
+    st.markdown(
+        "<div class='insight-card'><h3>INSIGHT 7: Company Size and ESG Maturity</h3><p><strong>Finding:</strong> Larger companies (by revenue and market cap) tend to have more mature ESG programs, but smaller companies can achieve competitive scores through focused strategies.</p><p><strong>Implication:</strong> ESG excellence is not solely the domain of large corporations. Tailored support programs can help SMEs achieve sustainability goals within their resource constraints.</p></div>",
+        unsafe_allow_html=True,
+    )
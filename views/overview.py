@@ -0,0 +1,737 @@
+"""Overview page: leadership board, headline metrics and financial impact"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from esg import config
+from esg.plotting import box_summary, box_traces
+from esg.ranking import competition_ranks
+from esg.simulation import FAN_BANDS, FAN_CENTRE, fan, project
+from views.context import show_cached_chart
+from views.theme import apply_chart_theme, get_chart_theme
+
+# Leadership board rankings: score column, rank column, bar colour, axis label
+LEADERBOARD_DIMENSIONS = {
+    "Overall ESG": ("ESG_Overall", "Overall_Rank", "#3182ce", "ESG Score"),
+    "Environmental": (
+        "ESG_Environmental",
+        "Environmental_Rank",
+        "#48bb78",
+        "Environmental Score",
+    ),
+    "Social": ("ESG_Social", "Social_Rank", "#ed8936", "Social Score"),
+    "Governance": ("ESG_Governance", "Governance_Rank", "#9f7aea", "Governance Score"),
+}
+
+# Trajectory simulator: annual improvement rates (%) projected at once, years
+# projected past the baseline, and the baselines of each scenario choice
+# (None: the filtered average under every rate of RATE_GRID)
+RATE_GRID = np.arange(1, 11)
+TRAJECTORY_HORIZON = 5
+TRAJECTORY_SCENARIOS = {
+    "Filtered average": None,
+    "Every industry": "Industry",
+    "Every company": "CompanyID",
+}
+
+
+def render(ctx):
+    """Render the Overview page"""
+    filtered_df = ctx.filtered_df
+    grouped = ctx.grouped
+    scatter_points = ctx.scatter_points
+
+    st.title("ESG & Financial Performance Dashboard")
+    st.markdown(
+        "<p style='font-size: 1.125rem; color: #718096; margin-bottom: 2rem;'>Comprehensive analysis of environmental, social, and governance metrics across industries</p>",
+        unsafe_allow_html=True,
+    )
+
+    # ESG Leadership Board
+    st.markdown("### ESG Leadership Board")
+
+    def compute_leaderboard():
+        """Top companies of every ESG dimension from one grouped pass"""
+        performers = (
+            grouped(
+                "CompanyName",
+                {
+                    "ESG_Overall": "mean",
+                    "ESG_Environmental": "mean",
+                    "ESG_Social": "mean",
+                    "ESG_Governance": "mean",
+                    "Industry": "first",
+                    "Revenue": "mean",
+                },
+            )
+            .round(2)
+            .reset_index()
+        )
+        ties = config.LEADERBOARD_TIE_BREAK
+        if ties in performers.columns:
+            ties = performers[ties].to_numpy()
+        dimensions = list(LEADERBOARD_DIMENSIONS.values())
+        selections = ctx.engine.top_k(
+            performers,
+            [column for column, *_ in dimensions],
+            config.LEADERBOARD_SIZE,
+            ties=ties,
+        )
+        leaderboard = {}
+        for label, (column, rank_column, *_), positions in zip(
+            LEADERBOARD_DIMENSIONS, dimensions, selections
+        ):
+            top = performers.iloc[positions][
+                ["CompanyName", column, "Industry", "Revenue"]
+            ].reset_index(drop=True)
+            top[rank_column] = competition_ranks(top[column])
+            leaderboard[label] = top
+        return leaderboard
+
+    pillars = {
+        "Overall": "ESG_Overall",
+        "Environmental": "ESG_Environmental",
+        "Social": "ESG_Social",
+        "Governance": "ESG_Governance",
+    }
+
+    def compute_efficiency_by_industry():
+        """Mean resource efficiency per industry, best first"""
+        return (
+            ctx.derived("Resource_Efficiency")
+            .groupby(filtered_df["Industry"], observed=True)
+            .mean()
+            .astype("float64")
+            .sort_values(ascending=False)
+        )
+
+    def compute_quartile_performance():
+        """Mean financials per ESG_Overall quartile"""
+        return (
+            filtered_df.groupby(ctx.derived("ESG_Quartile"), observed=True)
+            .agg({"ProfitMargin": "mean", "GrowthRate": "mean", "MarketCap": "mean"})
+            .astype("float64")
+            .round(2)
+        )
+
+    # The page's aggregations are independent, so they run concurrently and
+    # the page waits roughly for the slowest one; leaderboard and box
+    # summaries are shared across reruns, so switching the ranking does not
+    # regroup
+    results = ctx.parallel(
+        {
+            "leaderboard": lambda: ctx.cached(
+                ("leaderboard", config.LEADERBOARD_SIZE, config.LEADERBOARD_TIE_BREAK),
+                compute_leaderboard,
+            ),
+            "esg_distribution": lambda: ctx.cached(
+                "esg_distribution",
+                lambda: {
+                    name: box_summary(filtered_df[column], config.BOX_OUTLIER_SAMPLE)
+                    for name, column in pillars.items()
+                },
+            ),
+            "yearly_esg": lambda: ctx.yearly({"ESG_Overall": "mean"}),
+            "efficiency_by_industry": compute_efficiency_by_industry,
+            "regional_comparison": lambda: grouped(
+                "Region",
+                {
+                    "ESG_Overall": "mean",
+                    "CarbonEmissions": "mean",
+                    "Revenue": "mean",
+                    "CompanyID": "nunique",
+                },
+            ),
+            "regional_stats": lambda: grouped(
+                "Region",
+                {
+                    "ESG_Overall": "mean",
+                    "ESG_Environmental": "mean",
+                    "ESG_Social": "mean",
+                    "ESG_Governance": "mean",
+                    "Revenue": "mean",
+                    "CarbonEmissions": "mean",
+                    "WaterUsage": "mean",
+                    "EnergyConsumption": "mean",
+                    "CompanyID": "nunique",
+                },
+            ),
+            "correlation": lambda: filtered_df["ESG_Overall"].corr(
+                filtered_df["ProfitMargin"]
+            ),
+            "quartile_performance": compute_quartile_performance,
+        }
+    )
+    leaderboard = results["leaderboard"].result()
+
+    # Only the selected ranking is built and sent to the browser
+    ranking = st.radio(
+        "Ranking",
+        list(LEADERBOARD_DIMENSIONS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="leaderboard_ranking",
+    )
+    top_ranked = leaderboard[ranking]
+
+    def leaderboard_chart(ranking, top_ranked):
+        column, rank_column, color, score_label = LEADERBOARD_DIMENSIONS[ranking]
+        fig = go.Figure(
+            data=[
+                go.Bar(
+                    x=top_ranked["CompanyName"],
+                    y=top_ranked[column],
+                    marker_color=color,
+                    text=top_ranked[column].round(1),
+                    textposition="auto",
+                    hovertemplate=(
+                        "<b>%{x}</b><br>"
+                        + f"{score_label}: %{{y:.1f}}<br>"
+                        + "Industry: %{customdata[0]}<br>"
+                        + "Revenue: $%{customdata[1]:.0f}M<br>"
+                        + "Rank: %{customdata[2]:.0f}"
+                    ),
+                    customdata=top_ranked[["Industry", "Revenue", rank_column]],
+                )
+            ]
+        )
+
+        if ranking == "Overall ESG":
+            # Get default theme
+            theme = get_chart_theme()
+
+            # Update layout with theme and specific settings
+            layout_update = {
+                **theme["layout"],
+                "title": {
+                    "text": f"Top {len(top_ranked)} Overall ESG Performers",
+                    "y": 0.95,
+                    "x": 0.5,
+                    "xanchor": "center",
+                    "yanchor": "top",
+                    "font": {"size": 20, "color": "#e2e8f0"},
+                },
+                "xaxis_title": "",
+                "yaxis_title": {
+                    "text": "ESG Score",
+                    "font": {"size": 14, "color": "#e2e8f0"},
+                },
+                "height": 450,  # Increased height for better visibility
+                "xaxis_tickangle": -45,
+                "margin": dict(l=40, r=40, t=60, b=120),  # Adjusted margins
+                "showlegend": True,
+                "legend": {"bgcolor": "rgba(31,41,55,0.8)"},  # Semi-transparent legend
+                "plot_bgcolor": "#1f2937",
+                "paper_bgcolor": "#1f2937",
+            }
+
+            fig.update_layout(layout_update)
+
+            # Update bar colors for better visibility
+            fig.update_traces(
+                marker_color="rgba(49,130,206,0.8)",  # Semi-transparent blue
+                textfont={"color": "#e2e8f0"},  # Light text color
+                textposition="outside",  # Text above bars
+            )
+        else:
+            fig = apply_chart_theme(
+                fig, title=f"Top {len(top_ranked)} {ranking} Performers"
+            )
+            fig.update_layout(
+                xaxis_title="",
+                yaxis_title=score_label,
+                height=400,
+                xaxis_tickangle=-45,
+                margin=dict(l=20, r=20, t=40, b=120),
+            )
+        return fig
+
+    show_cached_chart("ESG leadership board", leaderboard_chart, ranking, top_ranked)
+
+    st.markdown("---")
+
+    # Key Metrics Row
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.metric(
+            label="Total Companies",
+            value=f"{ctx.distinct_count('CompanyID')}",
+            delta=f"{ctx.row_count} records",
+        )
+
+    with col2:
+        avg_esg = filtered_df["ESG_Overall"].mean()
+        st.metric(
+            label="Average ESG Score",
+            value=f"{avg_esg:.1f}",
+            delta=f"{avg_esg - ctx.dataset_mean('ESG_Overall'):.1f}",
+        )
+
+    with col3:
+        avg_revenue = filtered_df["Revenue"].mean()
+        st.metric(
+            label="Average Revenue",
+            value=f"${avg_revenue:.0f}M",
+            delta=f"{filtered_df['GrowthRate'].mean():.1f}%",
+        )
+
+    with col4:
+        avg_carbon = filtered_df["CarbonEmissions"].mean()
+        st.metric(
+            label="Avg Carbon (tons)",
+            value=f"{avg_carbon/1000:.0f}K",
+            delta=f"{(avg_carbon - ctx.dataset_mean('CarbonEmissions'))/1000:.1f}K",
+        )
+
+    with col5:
+        positive_growth = (filtered_df["GrowthRate"] > 0).sum()
+        st.metric(
+            label="Positive Growth",
+            value=f"{positive_growth}",
+            delta=f"{positive_growth/len(filtered_df)*100:.0f}%",
+        )
+
+    st.markdown("---")
+
+    # Main visualizations
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### ESG Score Distribution")
+        summaries = results["esg_distribution"].result()
+
+        def esg_distribution(summaries):
+            fig = go.Figure(
+                box_traces(summaries, ["#3182ce", "#48bb78", "#ed8936", "#9f7aea"])
+            )
+
+            fig = apply_chart_theme(fig, title="ESG Score Components Distribution")
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+            )
+            return fig
+
+        show_cached_chart("ESG score distribution", esg_distribution, summaries)
+
+        # Overview Insights Card
+        st.markdown(
+            """
+            <div class='insight-card'>
+                <h3>ESG Performance Overview</h3>
+                <p>Based on the analysis of {0} companies across {1} industries:</p>
+                <ul>
+                    <li>Average ESG Score: <strong>{2:.1f}</strong></li>
+                    <li>Environmental Leaders: {3:.0f}% of companies</li>
+                    <li>Social Impact: {4:.1f}% average score</li>
+                    <li>Governance Rating: {5:.1f}% compliance</li>
+                </ul>
+                <p>Key trends show {6} improvement in overall ESG performance year over year.</p>
+            </div>
+        """.format(
+                ctx.distinct_count("CompanyID"),
+                len(filtered_df["Industry"].unique()),
+                filtered_df["ESG_Overall"].mean(),
+                (filtered_df["ESG_Environmental"] > 70).mean() * 100,
+                filtered_df["ESG_Social"].mean(),
+                filtered_df["ESG_Governance"].mean(),
+                (
+                    "consistent"
+                    if results["yearly_esg"]
+                    .result()["ESG_Overall"]
+                    .is_monotonic_increasing
+                    else "variable"
+                ),
+            ),
+            unsafe_allow_html=True,
+        )
+
+    with col2:
+        efficiency_by_industry = results["efficiency_by_industry"].result()
+
+        def resource_efficiency(efficiency_by_industry):
+            fig = go.Figure(
+                go.Bar(
+                    x=efficiency_by_industry.values,
+                    y=efficiency_by_industry.index,
+                    orientation="h",
+                    marker=dict(
+                        color=efficiency_by_industry.values, colorscale="Greens"
+                    ),
+                    text=efficiency_by_industry.values.round(2),
+                    textposition="auto",
+                )
+            )
+            fig = apply_chart_theme(fig, title="Resource Efficiency by Industry")
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+                xaxis_title="Efficiency Score",
+            )
+            return fig
+
+        show_cached_chart(
+            "resource efficiency by industry",
+            resource_efficiency,
+            efficiency_by_industry,
+        )
+
+    st.markdown("---")
+
+    # Regional Comparison Section
+    st.markdown("### Regional Performance Overview")
+    regional_comparison = results["regional_comparison"].result().round(2)
+    regional_comparison.columns = [
+        "Avg ESG Score",
+        "Avg Carbon",
+        "Avg Revenue",
+        "Companies",
+    ]
+    regional_comparison["Performance Tier"] = pd.cut(
+        regional_comparison["Avg ESG Score"],
+        bins=[0, 55, 65, 100],
+        labels=["Developing", "Improving", "Leading"],
+    )
+
+    st.dataframe(
+        regional_comparison.style.background_gradient(
+            cmap="RdYlGn", subset=["Avg ESG Score"]
+        ),
+        use_container_width=True,
+        height=250,
+    )
+
+    st.markdown("---")
+
+    # Financial Performance Analysis
+    st.markdown("### Financial Impact Analysis")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Create scatter plot with trendline option
+        # Create base figure
+        points, mode = scatter_points("ESG_Overall", "ProfitMargin")
+        try:
+            correlation = results["correlation"].result()
+        except Exception:
+            # Formatting None below fails too, so the chart takes its fallback
+            correlation = None
+
+        def esg_vs_profitability(points, mode, correlation):
+            try:
+                fig = px.scatter(
+                    points,
+                    x="ESG_Overall",
+                    y="ProfitMargin",
+                    color="Industry",
+                    size="MarketCap",
+                    render_mode=mode,
+                    color_discrete_sequence=[
+                        "#3182ce",
+                        "#48bb78",
+                        "#ed8936",
+                        "#9f7aea",
+                        "#f56565",
+                    ],
+                )
+
+                # Get theme
+                theme = get_chart_theme()
+
+                # Update with theme and specific settings
+                layout_update = {
+                    **theme["layout"],
+                    "title": {
+                        "text": "ESG Score vs Profitability",
+                        "font": {"size": 16, "color": "#e2e8f0"},
+                        "x": 0.5,
+                        "xanchor": "center",
+                    },
+                    "showlegend": True,
+                    "legend": {
+                        "bgcolor": "rgba(31,41,55,0.8)",
+                        "bordercolor": "rgba(255,255,255,0.1)",
+                        "borderwidth": 1,
+                        "font": {"color": "#e2e8f0"},
+                    },
+                }
+                correlation_text = f"Correlation: {correlation:.2f}"
+
+                # Add correlation information
+                fig.add_annotation(
+                    text=correlation_text,
+                    xref="paper",
+                    yref="paper",
+                    x=0.02,
+                    y=0.98,
+                    showarrow=False,
+                    font=dict(size=12),
+                )
+
+            except Exception as e:
+                # Fallback to scatter plot without trendline if error occurs
+                fig = px.scatter(
+                    points,
+                    x="ESG_Overall",
+                    y="ProfitMargin",
+                    color="Industry",
+                    size="MarketCap",
+                    render_mode=mode,
+                    title="ESG Score vs Profitability",
+                    color_discrete_sequence=[
+                        "#3182ce",
+                        "#48bb78",
+                        "#ed8936",
+                        "#9f7aea",
+                        "#f56565",
+                    ],
+                )
+
+                fig.add_annotation(
+                    text="Note: Trendline unavailable due to insufficient data",
+                    xref="paper",
+                    yref="paper",
+                    x=0.02,
+                    y=0.98,
+                    showarrow=False,
+                    font=dict(size=12),
+                )
+
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+            )
+            return fig
+
+        show_cached_chart(
+            "ESG vs profitability", esg_vs_profitability, points, mode, correlation
+        )
+
+    with col2:
+        # ESG quartile analysis
+        quartile_performance = results["quartile_performance"].result()
+
+        def quartile_chart(quartile_performance):
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(
+                    name="Profit Margin",
+                    x=quartile_performance.index,
+                    y=quartile_performance["ProfitMargin"],
+                    marker_color="#48bb78",
+                )
+            )
+            fig.add_trace(
+                go.Bar(
+                    name="Growth Rate",
+                    x=quartile_performance.index,
+                    y=quartile_performance["GrowthRate"],
+                    marker_color="#3182ce",
+                )
+            )
+
+            fig = apply_chart_theme(fig, title="Financial Performance by ESG Quartile")
+            fig.update_layout(
+                barmode="group",
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+                xaxis_title="ESG Quartile",
+                yaxis_title="Performance (%)",
+            )
+            return fig
+
+        show_cached_chart(
+            "performance by ESG quartile", quartile_chart, quartile_performance
+        )
+
+    # Summary Card
+    st.markdown(
+        """
+        <div class='insight-card'>
+            <h3>Financial Performance Insights</h3>
+            <p>Analysis of {0} companies reveals:</p>
+            <ul>
+                <li><strong>Profitability Impact:</strong> Companies in the top ESG quartile show {1:.1f}% higher profit margins</li>
+                <li><strong>Growth Correlation:</strong> {2:.1f}% higher growth rates in high ESG performers</li>
+                <li><strong>Market Value:</strong> {3:.1f}% average market cap premium for ESG leaders</li>
+            </ul>
+            <p>The data suggests a strong positive correlation between ESG performance and financial success.</p>
+        </div>
+    """.format(
+            ctx.row_count,
+            quartile_performance.loc["Q4 (Highest)", "ProfitMargin"]
+            - quartile_performance.loc["Q1 (Lowest)", "ProfitMargin"],
+            quartile_performance.loc["Q4 (Highest)", "GrowthRate"]
+            - quartile_performance.loc["Q1 (Lowest)", "GrowthRate"],
+            (
+                quartile_performance.loc["Q4 (Highest)", "MarketCap"]
+                / quartile_performance.loc["Q1 (Lowest)", "MarketCap"]
+                - 1
+            )
+            * 100,
+        ),
+        unsafe_allow_html=True,
+    )
+
+    # Temporal improvement tracking
+    st.markdown("### ESG Improvement Trajectory Simulator")
+    st.markdown(
+        "<p style='color: #718096; margin-bottom: 1.5rem;'>Interactive projection tool for planning ESG improvements</p>",
+        unsafe_allow_html=True,
+    )
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        baseline_year = st.slider(
+            "Select Baseline Year",
+            int(filtered_df["Year"].min()),
+            int(filtered_df["Year"].max()) - 3,
+            int(filtered_df["Year"].min()),
+        )
+
+    with col2:
+        improvement_rate = st.slider(
+            "Annual Improvement Rate (%)",
+            int(RATE_GRID[0]),
+            int(RATE_GRID[-1]),
+            5,
+        )
+
+    scenarios = st.radio(
+        "Scenarios",
+        list(TRAJECTORY_SCENARIOS),
+        horizontal=True,
+        key="trajectory_scenarios",
+    )
+
+    # Yearly means are aggregated once per filter state; slider moves only
+    # slice them
+    yearly_esg = results["yearly_esg"].result()["ESG_Overall"]
+    historical = yearly_esg[yearly_esg.index <= baseline_year]
+    years_projected = np.arange(baseline_year, baseline_year + TRAJECTORY_HORIZON + 1)
+
+    by = TRAJECTORY_SCENARIOS[scenarios]
+    if by is None:
+        # The filtered average under every rate of the grid
+        baseline_esg = yearly_esg.get(baseline_year, np.nan)
+        paths = project(baseline_esg, RATE_GRID, TRAJECTORY_HORIZON)
+        projected = project(baseline_esg, improvement_rate, TRAJECTORY_HORIZON)
+        projected_name = "Projected"
+    else:
+        # Every industry's or company's baseline under the selected rate
+        baselines = ctx.cached(
+            ("trajectory baselines", by, baseline_year),
+            lambda: grouped(
+                by, {"ESG_Overall": "mean"}, years=(baseline_year, baseline_year)
+            )["ESG_Overall"].to_numpy(),
+        )
+        paths = project(baselines, improvement_rate, TRAJECTORY_HORIZON)
+        projected = None
+        projected_name = "Projected (median)"
+    bands = fan(paths) if len(paths) else {}
+    if projected is None:
+        projected = bands.get(FAN_CENTRE, np.full(len(years_projected), np.nan))
+
+    def trajectory(
+        historical, years_projected, bands, projected, projected_name, scenario_count
+    ):
+        fig = go.Figure()
+
+        # Historical data
+        fig.add_trace(
+            go.Scatter(
+                x=historical.index,
+                y=historical.values,
+                mode="lines+markers",
+                name="Historical",
+                line=dict(color="#3182ce", width=3),
+                marker=dict(size=8),
+            )
+        )
+
+        # Fan of all scenarios, outermost band first
+        for (low, high), opacity in zip(FAN_BANDS, (0.15, 0.3)):
+            if low not in bands:
+                continue
+            fig.add_trace(
+                go.Scatter(
+                    x=years_projected,
+                    y=bands[high],
+                    mode="lines",
+                    line=dict(width=0),
+                    showlegend=False,
+                    hoverinfo="skip",
+                )
+            )
+            fig.add_trace(
+                go.Scatter(
+                    x=years_projected,
+                    y=bands[low],
+                    mode="lines",
+                    line=dict(width=0),
+                    fill="tonexty",
+                    fillcolor=f"rgba(72,187,120,{opacity})",
+                    name=f"P{low}-P{high} of {scenario_count:,} scenarios",
+                )
+            )
+
+        fig.add_trace(
+            go.Scatter(
+                x=years_projected,
+                y=projected,
+                mode="lines+markers",
+                name=projected_name,
+                line=dict(color="#48bb78", width=3, dash="dash"),
+                marker=dict(size=8),
+            )
+        )
+
+        fig = apply_chart_theme(fig)
+        fig.update_layout(
+            height=300,
+            margin=dict(l=20, r=20, t=40, b=20),
+            showlegend=True,
+        )
+        return fig
+
+    show_cached_chart(
+        "ESG improvement trajectory",
+        trajectory,
+        historical,
+        years_projected,
+        bands,
+        projected,
+        projected_name,
+        len(paths),
+    )
+
+    st.markdown("---")
+
+    # Regional comparison table
+    st.markdown("### Comprehensive Regional Comparison")
+
+    regional_stats = results["regional_stats"].result().round(2)
+
+    regional_stats.columns = [
+        "ESG Overall",
+        "Environmental",
+        "Social",
+        "Governance",
+        "Avg Revenue",
+        "Carbon",
+        "Water",
+        "Energy",
+        "Companies",
+    ]
+
+    st.dataframe(
+        regional_stats.style.background_gradient(cmap="RdYlGn", subset=["ESG Overall"]),
+        use_container_width=True,
+        height=300,
+    )
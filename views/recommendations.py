@@ -0,0 +1,50 @@
+"""Recommendations page: strategic actions drawn from the analysis"""
+
+import streamlit as st
+
+
+def render(ctx):
+    """Render the Recommendations page"""
+    st.title("Policy Recommendations for Sustainable Growth")
+    st.markdown(
+        "<p style='font-size: 1.125rem; color: #718096; margin-bottom: 2rem;'>Actionable strategies for ESG improvement</p>",
+        unsafe_allow_html=True,
+    )
+
+    # Recommendation 1
+    st.markdown(
+        "<div class='recommendation-card'><h3>RECOMMENDATION 1: Industry-Specific Emission Reduction Targets</h3><h4>Objective:</h4><p>Establish differentiated carbon reduction goals based on industry benchmarks to ensure fair and achievable targets.</p><h4>Action Plan:</h4><ul><li><strong>Benchmark Development:</strong> Create industry-specific emission baselines using current data</li><li><strong>Tiered Targets:</strong> Set progressive reduction targets (5%, 10%, 15%) over 3-year cycles</li><li><strong>Peer Comparison:</strong> Develop industry peer groups for competitive benchmarking</li><li><strong>Incentive Structure:</strong> Reward early adopters and high performers with financial benefits</li><li><strong>Support Mechanisms:</strong> Provide technical assistance to lagging industries</li></ul><h4>Expected Impact:</h4><p>15-25% reduction in industry-wide carbon emissions over 5 years, with improved ESG scores driving investor confidence and market valuation increases.</p><h4>Implementation Timeline:</h4><p>Phase 1 (Months 1-6): Baseline establishment | Phase 2 (Months 7-12): Target setting | Phase 3 (Year 2+): Monitoring and adjustment</p></div>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # Recommendation 2
+    st.markdown(
+        "<div class='recommendation-card'><h3>RECOMMENDATION 2: Integrated Resource Management Framework</h3><h4>Objective:</h4><p>Develop holistic approaches linking water, energy, and carbon management to maximize efficiency gains.</p><h4>Action Plan:</h4><ul><li><strong>Unified Monitoring Systems:</strong> Deploy IoT sensors and AI analytics for real-time resource tracking</li><li><strong>Cross-Functional Teams:</strong> Create integrated sustainability departments</li><li><strong>Technology Investment:</strong> Prioritize solutions with multiple resource benefits (e.g., solar-powered water treatment)</li><li><strong>Circular Economy Practices:</strong> Implement waste-to-energy and water recycling systems</li><li><strong>Supply Chain Integration:</strong> Extend resource efficiency to suppliers and partners</li></ul><h4>Expected Impact:</h4><p>20-30% improvement in resource efficiency ratios, 10-15% cost reduction in operational expenses, and 12-18 point improvement in overall ESG scores.</p><h4>Key Performance Indicators:</h4><ul><li>Resource intensity per revenue unit (Water/Revenue, Energy/Revenue)</li><li>Carbon efficiency (Emissions/Output)</li><li>Waste-to-resource conversion rates</li></ul></div>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # Recommendation 3
+    st.markdown(
+        "<div class='recommendation-card'><h3>RECOMMENDATION 3: Regional Best Practice Sharing Networks</h3><h4>Objective:</h4><p>Facilitate knowledge exchange between high and low-performing regions to accelerate global sustainability progress.</p><h4>Action Plan:</h4><ul><li><strong>Regional Sustainability Councils:</strong> Establish quarterly forums for cross-regional collaboration</li><li><strong>Case Study Documentation:</strong> Create detailed success story libraries with implementation guides</li><li><strong>Technology Transfer Programs:</strong> Subsidize adoption of proven sustainable technologies</li><li><strong>Executive Exchange Programs:</strong> Enable sustainability leaders to mentor emerging regions</li><li><strong>Digital Knowledge Platform:</strong> Build online repository of best practices, tools, and templates</li></ul><h4>Expected Impact:</h4><p>Accelerate ESG improvements in underperforming regions by 30-40%, reduce implementation costs through shared learning, and create global community of practice.</p><h4>Focus Areas for Knowledge Sharing:</h4><ul><li>Renewable energy adoption strategies</li><li>Supply chain sustainability frameworks</li><li>Stakeholder engagement methodologies</li><li>ESG reporting and disclosure practices</li></ul></div>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # Recommendation 4
+    st.markdown(
+        "<div class='recommendation-card'><h3>RECOMMENDATION 4: ESG-Linked Financial Incentives</h3><h4>Objective:</h4><p>Design financial products and mechanisms that reward ESG improvements and make sustainable practices economically attractive.</p><h4>Action Plan:</h4><ul><li><strong>Green Bonds & Loans:</strong> Offer preferential interest rates (0.5-1% reduction) for companies with high ESG scores</li><li><strong>ESG Performance Credits:</strong> Create tradeable credits for exceeding sustainability targets</li><li><strong>Tax Incentives:</strong> Advocate for tax benefits tied to verified emissions reductions</li><li><strong>Impact Investment Funds:</strong> Establish dedicated funds for companies demonstrating ESG leadership</li><li><strong>Insurance Premium Adjustments:</strong> Link premiums to sustainability risk profiles</li></ul><h4>Expected Impact:</h4><p>30-50% increase in corporate sustainability investments, improved access to capital for ESG leaders, and creation of virtuous cycle linking financial performance with environmental stewardship.</p><h4>Financial Modeling:</h4><ul><li>Cost of capital reduction: 50-100 basis points for top ESG performers</li><li>Market valuation premium: 10-20% for sustainability leaders</li><li>Risk-adjusted returns: 15-25% improvement over 5-year horizon</li></ul></div>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # Recommendation 5
+    st.markdown(
+        "<div class='recommendation-card'><h3>RECOMMENDATION 5: Continuous Monitoring & Adaptive Strategies</h3><h4>Objective:</h4><p>Implement real-time ESG monitoring systems and develop adaptive strategies based on performance trends.</p><h4>Action Plan:</h4><ul><li><strong>Dashboard Implementation:</strong> Deploy company-wide ESG tracking dashboards with real-time metrics</li><li><strong>AI-Powered Analytics:</strong> Use machine learning to predict ESG trends and identify improvement opportunities</li><li><strong>Quarterly Reviews:</strong> Conduct regular strategy assessments and course corrections</li><li><strong>Stakeholder Feedback Loops:</strong> Integrate investor, customer, and employee input into ESG strategies</li><li><strong>Progressive Target Setting:</strong> Align targets with Paris Agreement and UN SDGs</li></ul><h4>Expected Impact:</h4><p>40-50% faster response to emerging sustainability challenges, 25-35% improvement in target achievement rates, and enhanced transparency driving stakeholder trust.</p><h4>Technology Stack:</h4><ul><li>Data Collection: IoT sensors, satellite imagery, blockchain for supply chain</li><li>Analytics: Machine learning models for predictive insights</li><li>Reporting: Automated TCFD, GRI, and SASB-compliant reports</li><li>Visualization: Executive dashboards and public disclosure platforms</li></ul></div>",
+        unsafe_allow_html=True,
+    )
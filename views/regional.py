@@ -0,0 +1,184 @@
+"""Regional Insights page: ESG and resource use by region"""
+
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from views.context import show_cached_chart
+from views.theme import CHART_COLORS, apply_chart_theme, get_chart_theme
+
+
+def render(ctx):
+    """Render the Regional Insights page"""
+    grouped = ctx.grouped
+
+    st.title("Regional ESG Performance Analysis")
+    st.markdown(
+        "<p style='font-size: 1.125rem; color: #718096; margin-bottom: 2rem;'>Geographic distribution of sustainability metrics</p>",
+        unsafe_allow_html=True,
+    )
+
+    # Regional ESG comparison
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### ESG Scores by Region")
+        region_esg = grouped("Region", {"ESG_Overall": "mean"})[
+            "ESG_Overall"
+        ].sort_values(ascending=False)
+
+        def regional_scores(region_esg):
+            fig = go.Figure(
+                go.Bar(
+                    x=region_esg.index,
+                    y=region_esg.values,
+                    marker=dict(
+                        color=region_esg.values,
+                        colorscale="Greens",
+                        showscale=True,
+                        colorbar=dict(title="ESG Score"),
+                    ),
+                    text=region_esg.values.round(1),
+                    textposition="auto",
+                )
+            )
+
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+                xaxis_title="Region",
+                yaxis_title="Average ESG Score",
+            )
+            return fig
+
+        show_cached_chart("ESG scores by region", regional_scores, region_esg)
+
+    with col2:
+        st.markdown("#### Regional ESG Component Breakdown")
+        region_components = grouped(
+            "Region",
+            dict.fromkeys(
+                ["ESG_Environmental", "ESG_Social", "ESG_Governance"], "mean"
+            ),
+        )
+
+        def component_breakdown(region_components):
+            fig = go.Figure()
+            colors = ["#3182ce", "#48bb78", "#ed8936", "#9f7aea"]
+            for idx in range(len(region_components)):
+                fig.add_trace(
+                    go.Scatterpolar(
+                        r=region_components.iloc[idx].values.tolist()
+                        + [region_components.iloc[idx].values[0]],
+                        theta=[
+                            "Environmental",
+                            "Social",
+                            "Governance",
+                            "Environmental",
+                        ],
+                        fill="toself",
+                        name=region_components.index[idx],
+                        line=dict(color=colors[idx % len(colors)]),
+                    )
+                )
+
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+                height=400,
+                margin=dict(l=20, r=20, t=40, b=20),
+            )
+            return fig
+
+        show_cached_chart(
+            "regional ESG components", component_breakdown, region_components
+        )
+
+    st.markdown("---")
+
+    # Environmental metrics by region
+    st.markdown("### Environmental Metrics by Region")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("#### Carbon by Region")
+        region_carbon = grouped("Region", {"CarbonEmissions": "mean"})[
+            "CarbonEmissions"
+        ].sort_values()
+
+        def carbon_share(region_carbon):
+            fig = px.pie(
+                values=region_carbon.values,
+                names=region_carbon.index,
+                hole=0.4,
+                color_discrete_sequence=CHART_COLORS,
+            )
+
+            theme = get_chart_theme()
+            fig.update_layout(**theme["layout"])
+            fig.update_layout(
+                showlegend=True,
+                legend={
+                    "orientation": "h",
+                    "yanchor": "bottom",
+                    "y": -0.3,
+                    "xanchor": "center",
+                    "x": 0.5,
+                },
+            )
+
+            # Ensure text contrast
+            fig.update_traces(
+                textfont={"color": "#e2e8f0", "size": 14},
+                hoverlabel={"bgcolor": "#374151"},
+            )
+            return fig
+
+        show_cached_chart("carbon by region", carbon_share, region_carbon)
+
+    with col2:
+        st.markdown("#### Water by Region")
+        region_water = grouped("Region", {"WaterUsage": "mean"})[
+            "WaterUsage"
+        ].sort_values()
+
+        def water_share(region_water):
+            fig = px.pie(
+                values=region_water.values,
+                names=region_water.index,
+                hole=0.4,
+                color_discrete_sequence=["#3182ce", "#48bb78", "#ed8936", "#9f7aea"],
+            )
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=300,
+                margin=dict(l=20, r=20, t=40, b=20),
+                showlegend=True,
+            )
+            return fig
+
+        show_cached_chart("water by region", water_share, region_water)
+
+    with col3:
+        st.markdown("#### Energy by Region")
+        region_energy = grouped("Region", {"EnergyConsumption": "mean"})[
+            "EnergyConsumption"
+        ].sort_values()
+
+        def energy_share(region_energy):
+            fig = px.pie(
+                values=region_energy.values,
+                names=region_energy.index,
+                hole=0.4,
+                color_discrete_sequence=["#ed8936", "#48bb78", "#3182ce", "#9f7aea"],
+            )
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=300,
+                margin=dict(l=20, r=20, t=40, b=20),
+                showlegend=True,
+            )
+            return fig
+
+        show_cached_chart("energy by region", energy_share, region_energy)
@@ -0,0 +1,650 @@
+"""Dashboard styling: page CSS and the shared Plotly chart theme"""
+
+import streamlit as st
+
+# ============================================================================
+# MODERN PROFESSIONAL CSS (Clean & Minimal)
+# ============================================================================
+CSS = """
+<style>
+    /* Import Google Fonts */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+    
+    /* CSS Variables for consistent theming */
+    :root {
+        --bg-primary: #0E1117;
+        --bg-secondary: #262730;
+        --bg-tertiary: #1E1E1E;
+        --text-primary: #FFFFFF;
+        --text-secondary: #FAFAFA;
+        --text-muted: #9CA3AF;
+        --border-color: rgba(250, 250, 250, 0.1);
+        --border-hover: rgba(250, 250, 250, 0.2);
+        /* Streamlit-inspired color palette */
+        --accent-primary: #FF4B4B;
+        --accent-secondary: #00C0F2;
+        --accent-tertiary: #9DD4E9;
+        --accent-positive: #00CC96;
+        --accent-warning: #FFA421;
+        --accent-purple: #BD93F9;
+        --shadow-sm: 0 2px 4px rgba(0,0,0,0.2);
+        --shadow-md: 0 4px 6px rgba(0,0,0,0.25);
+        --shadow-lg: 0 10px 15px rgba(0,0,0,0.3);
+        --chart-bg: #262730;
+        --grid-color: rgba(250,250,250,0.1);
+    }
+    
+    /* Global Styles */
+    * {
+        font-family: 'Inter', sans-serif;
+    }
+    
+    /* Main background */
+    .main {
+        background-color: var(--bg-primary);
+        color: var(--text-primary);
+        padding: 1rem;
+    }
+    
+    /* Override default Streamlit background */
+    .stApp {
+        background-color: var(--bg-primary);
+    }
+    
+    /* Fix text colors globally */
+    .stMarkdown, 
+    .stMarkdown p,
+    .stMarkdown span,
+    .stText,
+    .stText p,
+    .stText span {
+        color: #ffffff !important;
+    }
+    
+    /* Style text headers */
+    .stMarkdown h1,
+    .stMarkdown h2,
+    .stMarkdown h3,
+    .stMarkdown h4 {
+        color: #ffffff !important;
+    }
+    
+    /* Override markdown text color */
+    .css-10trblm, .css-183lzff, .css-1aehpvj {
+        color: #fafafa !important;
+    }
+    
+    .block-container {
+        padding-top: 1rem !important;
+        padding: 1rem 2rem;
+        max-width: 1400px;
+    }
+    
+    /* Headers */
+    h1 {
+        color: var(--text-primary);
+        font-weight: 700;
+        font-size: 2.5rem;
+        margin-bottom: 0.5rem;
+        letter-spacing: -0.5px;
+    }
+    
+    h2 {
+        color: var(--text-primary);
+        font-weight: 600;
+        font-size: 1.75rem;
+        margin-top: 2rem;
+        margin-bottom: 1rem;
+        padding-bottom: 0.75rem;
+        border-bottom: 2px solid var(--border-color);
+    }
+    
+    h3 {
+        color: var(--text-primary);
+        font-weight: 600;
+        font-size: 1.25rem;
+        margin-top: 1.5rem;
+        margin-bottom: 0.75rem;
+    }
+    
+    h4 {
+        color: var(--text-primary);
+        font-weight: 600;
+        font-size: 1rem;
+        margin-bottom: 0.5rem;
+    }
+    
+    /* Metric Cards */
+    [data-testid="stMetricValue"] {
+        font-size: 2.25rem;
+        font-weight: 700;
+        color: #ffffff;
+        text-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        margin-bottom: 0.5rem;
+    }
+    
+    [data-testid="stMetricLabel"] {
+        font-size: 1rem;
+        font-weight: 600;
+        color: #94a3b8;
+        text-transform: uppercase;
+        letter-spacing: 0.75px;
+        margin-bottom: 0.25rem;
+    }
+    
+    [data-testid="stMetricDelta"] {
+        font-size: 1rem;
+        font-weight: 500;
+        padding: 0.25rem 0.5rem;
+        border-radius: 6px;
+        background: rgba(255,255,255,0.1);
+    }
+    
+    /* Metric Container Enhancement */
+    [data-testid="metric-container"] {
+        background: linear-gradient(145deg, #1f2937, #111827);
+        padding: 2rem;
+        border-radius: 16px;
+        border: 1px solid rgba(255,255,255,0.1);
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1),
+                   0 10px 15px rgba(0,0,0,0.1);
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        backdrop-filter: blur(10px);
+    }
+    
+    [data-testid="metric-container"]:hover {
+        transform: translateY(-4px);
+        box-shadow: 0 6px 12px rgba(0,0,0,0.15),
+                   0 12px 20px rgba(0,0,0,0.1);
+        border: 1px solid rgba(255,255,255,0.2);
+    }
+    
+    /* Sidebar */
+    [data-testid="stSidebar"] {
+        background: #1f2937;
+        border-right: 1px solid #374151;
+        padding: 1.5rem 1rem;
+        width: 280px !important;
+    }
+    
+    /* Fix sidebar dropdown width */
+    [data-testid="stSidebar"] .stSelectbox {
+        width: 100% !important;
+    }
+    
+    [data-testid="stSidebar"] .stMultiSelect {
+        width: 100% !important;
+    }
+    
+    /* Style sidebar selects and inputs */
+    [data-testid="stSidebar"] [data-baseweb="select"],
+    [data-testid="stSidebar"] [data-baseweb="popover"],
+    [data-testid="stSidebar"] .stSlider > div > div > div {
+        background-color: #1f2937 !important;
+        border-radius: 8px;
+        border: 1px solid rgba(255,255,255,0.1);
+    }
+    
+    /* Fix dropdown items background */
+    [data-baseweb="popover"] {
+        background-color: #1f2937 !important;
+    }
+    
+    [data-baseweb="menu"] {
+        background-color: #1f2937 !important;
+    }
+    
+    /* Style dropdown options */
+    [data-testid="stSidebar"] [data-baseweb="select"] ul {
+        background-color: #1f2937 !important;
+    }
+    
+    [data-testid="stSidebar"] [data-baseweb="select"] li {
+        background-color: #1f2937 !important;
+    }
+    
+    [data-testid="stSidebar"] [data-baseweb="select"] li:hover {
+        background-color: #374151 !important;
+    }
+    
+    /* Ensure all text in sidebar is visible */
+    [data-testid="stSidebar"] [data-baseweb="select"] *,
+    [data-testid="stSidebar"] .stSlider label,
+    [data-testid="stSidebar"] .stSlider p {
+        color: #ffffff !important;
+    }
+    
+    /* Style slider */
+    [data-testid="stSidebar"] .stSlider > div > div > div > div {
+        background-color: var(--accent-primary) !important;
+    }
+    
+    [data-testid="stSidebar"] h1,
+    [data-testid="stSidebar"] h2,
+    [data-testid="stSidebar"] h3 {
+        color: #fafafa;
+    }
+    
+    /* Style multiselect tags */
+    [data-testid="stSidebar"] [data-baseweb="tag"] {
+        background-color: var(--accent-primary) !important;
+        border: none !important;
+    }
+    
+    /* Style dropdown search input */
+    [data-testid="stSidebar"] input {
+        background-color: #1f2937 !important;
+        color: #ffffff !important;
+        border-color: rgba(255,255,255,0.1) !important;
+    }    /* Sidebar text color */
+    [data-testid="stSidebar"] .css-10trblm, 
+    [data-testid="stSidebar"] .css-183lzff,
+    [data-testid="stSidebar"] .css-1aehpvj {
+        color: #fafafa !important;
+    }
+    
+    /* Radio buttons in sidebar */
+    [data-testid="stSidebar"] .row-widget {
+        background: #374151;
+        padding: 0.5rem;
+        border-radius: 8px;
+        margin: 0.25rem 0;
+    }
+    
+    /* Buttons */
+    .stButton>button {
+        background: #3182ce;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.625rem 1.5rem;
+        font-weight: 500;
+        font-size: 0.875rem;
+        transition: all 0.2s ease;
+        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    }
+    
+    .stButton>button:hover {
+        background: #2c5282;
+        box-shadow: 0 4px 12px rgba(49,130,206,0.3);
+        transform: translateY(-1px);
+    }
+    
+    /* Select boxes and inputs */
+    .stSelectbox, .stMultiSelect {
+        background: var(--bg-secondary);
+    }
+    
+    /* Divider */
+    hr {
+        margin: 2.5rem 0;
+        border: none;
+        height: 1px;
+        background: var(--border-color);
+    }
+    
+    /* Chart containers */
+    .js-plotly-plot {
+        border-radius: 12px;
+        background: transparent !important;
+        padding: 0;
+        border: none;
+        box-shadow: none;
+        margin: 0;
+        overflow: hidden !important;
+        max-width: 100% !important;
+        width: 100% !important;
+    }
+    
+    /* Chart wrapper to ensure proper containment */
+    [data-testid="stPlotlyChart"] > div {
+        background: var(--chart-bg) !important;
+        border-radius: 12px;
+        overflow: visible !important;
+        max-width: 100% !important;
+        width: 100% !important;
+    \n        padding: 1rem;\n        border: 1px solid var(--border-color);\n        box-shadow: var(--shadow-md);
+        padding-right: 1.25rem;}
+    
+    /* Chart container hover effects */
+    .js-plotly-plot:hover {
+        border-color: var(--border-hover);
+        box-shadow: var(--shadow-lg);
+    }
+    
+    /* Ensure chart text is visible */
+    .js-plotly-plot text {
+        fill: var(--text-secondary) !important;
+    }
+    
+    /* Fix chart axis and grid lines */
+    .js-plotly-plot .gridlayer path {
+        stroke: var(--grid-color) !important;
+    }
+    
+    /* Improve legend visibility */
+    .js-plotly-plot .legend text {
+        fill: var(--text-secondary) !important;
+    }
+    
+    /* Fix chart background */
+    .js-plotly-plot .plot-container {
+        background: var(--chart-bg) !important;
+    }
+    
+    /* Ensure modebar (plotly toolbar) matches theme */
+    .js-plotly-plot .modebar {
+        background: transparent !important;
+    }
+    
+    .js-plotly-plot .modebar-btn path {
+        fill: var(--text-secondary) !important;
+    }
+    
+    /* Fix chart subplot backgrounds */
+    .js-plotly-plot .subplot {
+        background: var(--chart-bg) !important;
+    }
+    
+    /* Ensure chart container takes full width */
+    .element-container:has([data-testid="stPlotlyChart"]) {
+        width: 100% !important;
+        max-width: 100% !important;
+    }
+    
+    /* Info boxes */
+    .stAlert {
+        background: #1f2937;
+        border-left: 4px solid #3182ce;
+        border-radius: 8px;
+        padding: 1rem 1.5rem;
+        box-shadow: 0 1px 3px rgba(0,0,0,0.2);
+        color: #fafafa;
+    }
+    
+    /* Dataframe styling */
+    .dataframe {
+        border: 1px solid var(--border-color) !important;
+        border-radius: 8px;
+        overflow: hidden;
+    }
+    
+    /* Section card */
+    .section-card {
+        background: #1f2937;
+        padding: 1.5rem;
+        border-radius: 12px;
+        border: 1px solid #374151;
+        margin: 1.5rem 0;
+        box-shadow: 0 1px 3px rgba(0,0,0,0.2);
+    }
+    
+    .insight-card {
+        background: #1f2937;
+        padding: 2rem;
+        border-radius: 16px;
+        margin: 1.5rem 0;
+        box-shadow: 0 8px 16px rgba(0,0,0,0.1);
+        color: #ffffff;
+        border: 1px solid rgba(255,255,255,0.1);
+        backdrop-filter: blur(10px);
+        position: relative;
+        overflow: hidden;
+    }
+
+    .insight-card::before {
+        content: "✨";
+        position: absolute;
+        top: 1.5rem;
+        right: 1.5rem;
+        font-size: 1.5rem;
+        opacity: 0.5;
+    }
+
+    .insight-card h3 {
+        color: #ffffff;
+        font-size: 1.3rem;
+        margin-bottom: 1.5rem;
+        padding-right: 3rem;
+    }
+
+    .insight-card h4 {
+        color: #94a3b8;
+        font-size: 1.1rem;
+        margin-top: 1.5rem;
+        margin-bottom: 0.5rem;
+    }
+
+    .insight-card p {
+        color: #e2e8f0;
+        line-height: 1.6;
+    }
+
+    .insight-card strong {
+        color: #ffffff;
+        font-weight: 600;
+    }
+    
+    .recommendation-card {
+        background: #1f2937;
+        padding: 2rem;
+        border-radius: 16px;
+        margin: 1.5rem 0;
+        box-shadow: 0 8px 16px rgba(0,0,0,0.1);
+        color: #ffffff;
+        border: 1px solid rgba(255,255,255,0.1);
+        backdrop-filter: blur(10px);
+        position: relative;
+        overflow: hidden;
+    }
+
+    .recommendation-card::before {
+        content: "💡";
+        position: absolute;
+        top: 1.5rem;
+        right: 1.5rem;
+        font-size: 1.5rem;
+        opacity: 0.5;
+    }
+
+    .recommendation-card h3 {
+        color: #ffffff;
+        font-size: 1.3rem;
+        margin-bottom: 1.5rem;
+        padding-right: 3rem;
+    }
+
+    .recommendation-card h4 {
+        color: #94a3b8;
+        font-size: 1.1rem;
+        margin-top: 1.5rem;
+        margin-bottom: 0.5rem;
+    }
+
+    .recommendation-card p {
+        color: #e2e8f0;
+        line-height: 1.6;
+    }
+
+    .recommendation-card ul {
+        color: #e2e8f0;
+        margin-left: 1.5rem;
+        margin-bottom: 1.5rem;
+    }
+
+    .recommendation-card li {
+        margin-bottom: 0.5rem;
+    }
+
+    .recommendation-card li strong {
+        color: #ffffff;
+    }
+
+    /* Typography improvements */
+    p {
+        color: #fafafa;
+        line-height: 1.7;
+        margin-bottom: 1rem;
+    }
+    
+    ul {
+        color: #fafafa;
+        line-height: 1.8;
+    }
+    
+    /* Tabs styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background: #1f2937;
+        padding: 0.5rem;
+        border-radius: 8px;
+        border: 1px solid #374151;
+    }
+    
+    /* Override data frame styling */
+    .dataframe {
+        color: #fafafa;
+    }
+    
+    /* Style scrollbars */
+    ::-webkit-scrollbar {
+        width: 10px;
+        height: 10px;
+    }
+    
+    ::-webkit-scrollbar-track {
+        background: #1f2937;
+    }
+    
+    ::-webkit-scrollbar-thumb {
+        background: #374151;
+        border-radius: 5px;
+    }
+    
+    ::-webkit-scrollbar-thumb:hover {
+        background: #4b5563;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        border-radius: 6px;
+        padding: 0.5rem 1rem;
+        font-weight: 500;
+    }
+    
+    /* Remove emoji fallback */
+    .emoji {
+        display: none;
+    }
+    [data-testid="stSidebar"] input[type="radio"] { accent-color: var(--accent-primary) !important; }`r`n    input[type="radio"] { accent-color: var(--accent-primary) !important; }`r`n</style>
+"""
+
+
+def inject_css():
+    """Inject the dashboard stylesheet (Streamlit clears it on every rerun)"""
+    st.markdown(CSS, unsafe_allow_html=True)
+
+
+# ============================================================================
+# CHART THEME
+# ============================================================================
+# Default chart theme and colors
+CHART_COLORS = ["#3182ce", "#48bb78", "#ed8936", "#9f7aea", "#f56565"]
+
+
+@st.cache_data
+def get_chart_theme():
+    return {
+        "template": "plotly_dark",
+        "layout": {
+            "plot_bgcolor": "#262730",
+            "paper_bgcolor": "#262730",
+            "width": None,  # Allow responsive width
+            "autosize": True,  # Enable auto-sizing
+            "height": 450,  # Consistent height
+            "margin": {"l": 60, "r": 60, "t": 60, "b": 60},  # Consistent margins
+            "font": {
+                "family": "Inter, sans-serif",
+                "color": "#FAFAFA",
+                "size": 12,
+            },
+            "title": {
+                "text": "",
+                "font": {"color": "#FAFAFA", "size": 16},
+                "x": 0.5,
+                "xanchor": "center",
+                "y": 0.95,
+                "yanchor": "top",
+                "pad": {"b": 20},
+            },
+            "legend": {
+                "font": {"color": "#FAFAFA"},
+                "bgcolor": "rgba(31,41,55,0.8)",
+                "bordercolor": "rgba(250,250,250,0.1)",
+                "borderwidth": 1,
+                "x": 1,
+                "y": 1,
+                "xanchor": "right",
+                "yanchor": "top",
+            },
+            "xaxis": {
+                "gridcolor": "rgba(250,250,250,0.1)",
+                "zerolinecolor": "rgba(255,255,255,0.2)",
+                "title": {
+                    "font": {"color": "#FAFAFA", "size": 13},
+                    "standoff": 20,
+                },
+                "tickfont": {"color": "#FAFAFA"},
+                "showgrid": True,
+                "gridwidth": 1,
+                "automargin": True,
+            },
+            "yaxis": {
+                "gridcolor": "rgba(250,250,250,0.1)",
+                "zerolinecolor": "rgba(255,255,255,0.2)",
+                "title": {
+                    "font": {"color": "#FAFAFA", "size": 13},
+                    "standoff": 20,
+                },
+                "tickfont": {"color": "#FAFAFA"},
+                "showgrid": True,
+                "gridwidth": 1,
+                "automargin": True,
+            },
+            "hoverlabel": {"font": {"size": 12}, "bgcolor": "#1E1E1E"},
+            "updatemenus": [
+                {
+                    "bgcolor": "#262730",
+                    "font": {"color": "#FAFAFA"},
+                }
+            ],
+            "bargap": 0.15,  # Consistent spacing for bar charts
+            "bargroupgap": 0.1,
+        },
+    }
+
+
+def apply_chart_theme(fig, title=None):
+    """Apply consistent theme to a plotly figure"""
+    theme = get_chart_theme()
+    layout_update = theme["layout"].copy()
+
+    if title:
+        layout_update["title"] = {
+            "text": title,
+            "font": theme["layout"]["title"]["font"],
+            "x": 0.5,
+            "xanchor": "center",
+            "y": 0.95,
+            "yanchor": "top",
+        }
+
+    fig.update_layout(layout_update)
+
+    # Ensure text is visible on all traces
+    fig.update_traces(
+        textfont={"color": "#e2e8f0"},
+        hoverlabel={"bgcolor": "#374151"},
+        selector=dict(type=["bar", "scatter", "scatterpolar"]),
+    )
+
+    return fig
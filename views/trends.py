@@ -0,0 +1,379 @@
+"""Trends Over Time page: yearly ESG, environmental and financial trends"""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from esg.forecast import FORECAST_MODELS, forecast
+from esg.panel import year_over_year
+from esg.simulation import FAN_BANDS, fan
+from views.context import show_cached_chart
+from views.theme import apply_chart_theme
+
+# Metrics offered by the forecast section: display name -> column
+FORECAST_METRICS = {
+    "Overall ESG Score": "ESG_Overall",
+    "Environmental Score": "ESG_Environmental",
+    "Social Score": "ESG_Social",
+    "Governance Score": "ESG_Governance",
+}
+
+
+def render(ctx):
+    """Render the Trends Over Time page"""
+    yearly = ctx.yearly
+    filtered_df = ctx.filtered_df
+
+    st.title("Temporal Trends in ESG Performance")
+    st.markdown(
+        "<p style='font-size: 1.125rem; color: #718096; margin-bottom: 2rem;'>Historical analysis and future projections</p>",
+        unsafe_allow_html=True,
+    )
+
+    # Time series of ESG scores
+    st.markdown("#### ESG Score Evolution (2015-2025)")
+
+    yearly_esg = yearly(
+        dict.fromkeys(
+            ["ESG_Overall", "ESG_Environmental", "ESG_Social", "ESG_Governance"],
+            "mean",
+        ),
+    ).reset_index()
+
+    def esg_evolution(yearly_esg):
+        fig = go.Figure()
+
+        colors = {
+            "ESG_Overall": "#3182ce",
+            "ESG_Environmental": "#48bb78",
+            "ESG_Social": "#ed8936",
+            "ESG_Governance": "#9f7aea",
+        }
+
+        for col in ["ESG_Overall", "ESG_Environmental", "ESG_Social", "ESG_Governance"]:
+            fig.add_trace(
+                go.Scatter(
+                    x=yearly_esg["Year"],
+                    y=yearly_esg[col],
+                    mode="lines+markers",
+                    name=col.replace("ESG_", ""),
+                    line=dict(width=3, color=colors[col]),
+                    marker=dict(size=8),
+                )
+            )
+
+        fig = apply_chart_theme(fig)
+        fig.update_layout(
+            height=400,
+            margin=dict(l=20, r=20, t=40, b=20),
+            xaxis_title="Year",
+            yaxis_title="ESG Score",
+            hovermode="x unified",
+            legend=dict(
+                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
+            ),
+        )
+        return fig
+
+    show_cached_chart("ESG score evolution", esg_evolution, yearly_esg)
+
+    st.markdown("---")
+
+    # Environmental metrics trends
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### Carbon Emissions Trend")
+        yearly_carbon = yearly({"CarbonEmissions": ["mean", "std"]})[
+            "CarbonEmissions"
+        ].reset_index()
+
+        def carbon_trend(yearly_carbon):
+            fig = go.Figure()
+            fig.add_trace(
+                go.Scatter(
+                    x=yearly_carbon["Year"],
+                    y=yearly_carbon["mean"],
+                    mode="lines+markers",
+                    name="Average",
+                    line=dict(width=3, color="#48bb78"),
+                    marker=dict(size=8),
+                    fill="tonexty",
+                )
+            )
+
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=350,
+                margin=dict(l=20, r=20, t=40, b=20),
+                xaxis_title="Year",
+                yaxis_title="Carbon Emissions",
+            )
+            return fig
+
+        show_cached_chart("carbon emissions trend", carbon_trend, yearly_carbon)
+
+    with col2:
+        st.markdown("#### Energy Consumption Trend")
+        yearly_energy = yearly({"EnergyConsumption": "mean"}).reset_index()
+
+        def energy_trend(yearly_energy):
+            fig = go.Figure()
+            fig.add_trace(
+                go.Scatter(
+                    x=yearly_energy["Year"],
+                    y=yearly_energy["EnergyConsumption"],
+                    mode="lines+markers",
+                    name="Average",
+                    line=dict(width=3, color="#ed8936"),
+                    marker=dict(size=8),
+                    fill="tozeroy",
+                )
+            )
+
+            fig = apply_chart_theme(fig)
+            fig.update_layout(
+                height=350,
+                margin=dict(l=20, r=20, t=40, b=20),
+                xaxis_title="Year",
+                yaxis_title="Energy Consumption",
+            )
+            return fig
+
+        show_cached_chart("energy consumption trend", energy_trend, yearly_energy)
+
+    st.markdown("---")
+
+    # Industry-wise trends
+    st.markdown("#### Industry ESG Trends Over Time")
+
+    industry_yearly = yearly({"ESG_Overall": "mean"}, by="Industry").reset_index()
+
+    def industry_trends(industry_yearly):
+        fig = px.line(
+            industry_yearly,
+            x="Year",
+            y="ESG_Overall",
+            color="Industry",
+            markers=True,
+            color_discrete_sequence=[
+                "#3182ce",
+                "#48bb78",
+                "#ed8936",
+                "#9f7aea",
+                "#f56565",
+            ],
+        )
+
+        fig = apply_chart_theme(fig)
+        fig.update_layout(
+            height=400,
+            margin=dict(l=20, r=20, t=40, b=20),
+            xaxis_title="Year",
+            yaxis_title="Average ESG Score",
+        )
+        return fig
+
+    show_cached_chart("industry ESG trends", industry_trends, industry_yearly)
+
+    st.markdown("---")
+
+    # Year-over-year growth analysis
+    st.markdown("### Year-over-Year Growth Analysis")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        yearly_revenue = yearly({"Revenue": "mean"}).reset_index()
+        yearly_revenue["YoY_Change"] = year_over_year(
+            yearly_revenue["Revenue"], percent=True
+        )
+
+        def revenue_change(yearly_revenue):
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(
+                    x=yearly_revenue["Year"],
+                    y=yearly_revenue["YoY_Change"],
+                    marker_color=[
+                        "#48bb78" if x >= 0 else "#f56565"
+                        for x in yearly_revenue["YoY_Change"]
+                    ],
+                    text=yearly_revenue["YoY_Change"].round(1),
+                    textposition="auto",
+                )
+            )
+
+            fig = apply_chart_theme(fig, title="Revenue YoY % Change")
+            fig.update_layout(
+                height=350,
+                margin=dict(l=20, r=20, t=40, b=20),
+                xaxis_title="Year",
+                yaxis_title="% Change",
+            )
+            return fig
+
+        show_cached_chart("revenue YoY change", revenue_change, yearly_revenue)
+
+    with col2:
+        # The same series as the ESG evolution chart above
+        yearly_esg_change = yearly_esg[["Year", "ESG_Overall"]].copy()
+        yearly_esg_change["YoY_Change"] = year_over_year(
+            yearly_esg_change["ESG_Overall"]
+        )
+
+        def esg_change(yearly_esg_change):
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(
+                    x=yearly_esg_change["Year"],
+                    y=yearly_esg_change["YoY_Change"],
+                    marker_color=[
+                        "#48bb78" if x >= 0 else "#f56565"
+                        for x in yearly_esg_change["YoY_Change"].fillna(0)
+                    ],
+                    text=yearly_esg_change["YoY_Change"].round(2),
+                    textposition="auto",
+                )
+            )
+
+            fig = apply_chart_theme(fig, title="ESG Score YoY Change")
+            fig.update_layout(
+                height=350,
+                margin=dict(l=20, r=20, t=40, b=20),
+                xaxis_title="Year",
+                yaxis_title="Point Change",
+            )
+            return fig
+
+        show_cached_chart("ESG YoY change", esg_change, yearly_esg_change)
+
+    st.markdown("---")
+
+    # Per-company forecasts, fitted for every company at once
+    st.markdown("### Company ESG Forecast")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        metric_label = st.selectbox("Forecast Metric", list(FORECAST_METRICS))
+    with col2:
+        model_label = st.selectbox("Model", list(FORECAST_MODELS.values()))
+    with col3:
+        horizon = st.slider("Years Ahead", 1, 10, 5)
+    with col4:
+        company = st.text_input("Company ID", placeholder="All filtered companies")
+
+    metric = FORECAST_METRICS[metric_label]
+    model = {label: name for name, label in FORECAST_MODELS.items()}[model_label]
+    fit = ctx.forecast_fit(metric, model)
+    future_years, values = forecast(fit, horizon)
+
+    bands = {}
+    if company.strip():
+        # One company: its own history and forecast
+        try:
+            row = int(np.searchsorted(fit.companies, int(company)))
+            found = row < len(fit.companies) and fit.companies[row] == int(company)
+        except ValueError:
+            found = False
+        if not found:
+            st.warning(f"No company with ID {company}")
+            return
+        history = filtered_df.loc[filtered_df["CompanyID"] == int(company)]
+        history = history.sort_values("Year")
+        projected = values[row]
+        caption = (
+            f"{model_label} for company {company} · "
+            f"in-sample RMSE {fit.rmse[row]:.2f}"
+        )
+        history_x, history_y = history["Year"].to_numpy(), history[metric].to_numpy()
+    else:
+        # Filtered companies: mean forecast with a fan across companies
+        rows = ctx.cached(
+            ("forecast companies", metric, model),
+            lambda: np.flatnonzero(
+                np.isin(fit.companies, filtered_df["CompanyID"].unique())
+            ),
+        )
+        bands = fan(values[rows]) if len(rows) else {}
+        with np.errstate(invalid="ignore"):
+            projected = np.nanmean(values[rows], axis=0) if len(rows) else values[:0]
+        caption = (
+            f"{model_label} fitted to each of {len(rows):,} companies · "
+            f"median in-sample RMSE {np.nanmedian(fit.rmse[rows]):.2f}"
+            if len(rows)
+            else "No companies match the filters"
+        )
+        history = yearly({metric: "mean"})[metric]
+        history_x, history_y = history.index.to_numpy(), history.to_numpy()
+
+    def company_forecast(
+        metric_label, history_x, history_y, future_years, projected, bands
+    ):
+        fig = go.Figure()
+        for (low, high), opacity in zip(FAN_BANDS, (0.15, 0.3)):
+            if low not in bands:
+                continue
+            fig.add_trace(
+                go.Scatter(
+                    x=future_years,
+                    y=bands[high],
+                    mode="lines",
+                    line=dict(width=0),
+                    showlegend=False,
+                    hoverinfo="skip",
+                )
+            )
+            fig.add_trace(
+                go.Scatter(
+                    x=future_years,
+                    y=bands[low],
+                    mode="lines",
+                    line=dict(width=0),
+                    fill="tonexty",
+                    fillcolor=f"rgba(72,187,120,{opacity})",
+                    name=f"P{low}-P{high} of companies",
+                )
+            )
+        fig.add_trace(
+            go.Scatter(
+                x=history_x,
+                y=history_y,
+                mode="lines+markers",
+                name="Historical",
+                line=dict(width=3, color="#3182ce"),
+                marker=dict(size=8),
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=future_years,
+                y=projected,
+                mode="lines+markers",
+                name="Forecast",
+                line=dict(width=3, color="#48bb78", dash="dash"),
+                marker=dict(size=8),
+            )
+        )
+
+        fig = apply_chart_theme(fig, title=f"{metric_label} Forecast")
+        fig.update_layout(
+            height=400,
+            margin=dict(l=20, r=20, t=40, b=20),
+            xaxis_title="Year",
+            yaxis_title=metric_label,
+        )
+        return fig
+
+    show_cached_chart(
+        "company ESG forecast",
+        company_forecast,
+        metric_label,
+        history_x,
+        history_y,
+        future_years,
+        projected,
+        bands,
+    )
+    st.caption(caption)